@@ -4,24 +4,81 @@ import os
 import json
 import threading
 import logging
+import contextvars
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import time
+import socket
+import re
+import mmap
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                             QComboBox, QProgressBar, QTextEdit, QFileDialog,
                             QCheckBox, QGroupBox, QTableWidget, QTableWidgetItem,
                             QHeaderView, QMenu, QMessageBox, QSizePolicy)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QMimeData, QUrl
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot, QMimeData, QUrl
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QAction, QFont, QFontDatabase
-import youtube_downloader as yd
-import yt_dlp
-from ytsummarator import SummaryDepth
 
 # Import themes
 from themes import get_matrix_stylesheet, get_dark_stylesheet, AVAILABLE_THEMES
 
+def json_dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Config file for storing user preferences
 CONFIG_FILE = os.path.expanduser("~/.youtube_extractor_config.json")
 
+# Cache of fetched video titles, keyed by video ID
+TITLE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".youtube_extractor_cache.json")
+TITLE_CACHE_MAX_AGE = 604800  # Drop cached titles after 7 days
+
+# Pattern matches all ANSI escape sequences
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Matches progress lines that only belong in the progress bar, not the log
+PROGRESS_PATTERN = re.compile(r'Downloading:|ETA:|Speed:|%')
+
+# Translation table removing control characters except newline (this
+# covers stray \x1b, \r and \x08 too)
+CONTROL_CHARS = {i: None for i in range(32) if i != ord('\n')}
+
+# Matches URLs in raw bytes when loading URL files
+URL_PATTERN = re.compile(rb'https?://[^\s\'"<>]+')
+
+# YouTube hosts looked up ahead of the first request
+YOUTUBE_HOSTS = ("www.youtube.com", "youtubei.googleapis.com", "i.ytimg.com")
+
+def prewarm_dns():
+    """Resolve YouTube hosts in a background thread.
+    
+    The answers land in the system resolver's cache (mDNSResponder on macOS,
+    systemd-resolved on most Linux desktops), so the first title fetch
+    doesn't wait on DNS. Later fetches reuse their extractor's open
+    connections and don't resolve again.
+    """
+    def resolve_hosts():
+        for host in YOUTUBE_HOSTS:
+            try:
+                # Same arguments socket.create_connection uses for HTTPS
+                socket.getaddrinfo(host, 443, 0, socket.SOCK_STREAM)
+            except OSError:
+                pass
+    
+    threading.Thread(target=resolve_hosts, daemon=True).start()
+
 # Configure default font
 def configure_application_font():
     """Configure the application's default font."""
@@ -37,13 +94,21 @@ def configure_application_font():
     # If no monospace font is found, use system default
     QApplication.setFont(QFont("", 10))
 
+def get_max_worker_threads():
+    """Return how many background worker threads to allow at once."""
+    # Free-threaded builds (3.13+) run Python code in parallel, so use every core;
+    # with the GIL, extra threads only add contention for our I/O-bound work
+    if getattr(sys, '_is_gil_enabled', lambda: True)() is False:
+        return os.cpu_count() or 4
+    return 4
+
 def load_config():
     """Load configuration from file."""
     default_config = {
         "last_output_folder": "",
         "last_format": "mp4",
         "last_quality": "best",
-        "last_depth": SummaryDepth.DETAILED.value,
+        "last_depth": "detailed",  # SummaryDepth.DETAILED.value
         "last_model": "gpt-3.5-turbo-16k",  # Updated default model (using larger context window)
         "window_width": 900,
         "window_height": 700,
@@ -52,8 +117,8 @@ def load_config():
     
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                config = json_loads(f.read())
                 # Ensure all default keys exist
                 for key, value in default_config.items():
                     if key not in config:
@@ -66,11 +131,79 @@ def load_config():
 def save_config(config):
     """Save configuration to file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
+        with open(CONFIG_FILE, 'wb', buffering=8192) as f:
+            f.write(json_dumps(config))
     except Exception as e:
         print(f"Error saving config: {e}")
 
+def clean_text(text):
+    """Strip ANSI color codes and other control sequences from a message."""
+    # Most messages are plain text; isprintable() is false for ESC and every
+    # other control character, so it rules out both passes in one scan
+    if text.isprintable():
+        return text
+    # First remove ANSI escape sequences, then any other control characters
+    return ANSI_ESCAPE_PATTERN.sub('', text).translate(CONTROL_CHARS)
+
+# Logger used by youtube_downloader for the current thread; each download
+# worker binds its own so concurrent downloads don't share one global
+_current_logger = contextvars.ContextVar('yd_logger')
+
+class ContextLogger:
+    """Proxy for yd.logger that forwards to the logger bound in the current context."""
+    def __init__(self, default):
+        self.default = default
+    
+    def __getattr__(self, name):
+        return getattr(_current_logger.get(self.default), name)
+
+_yd = None
+
+def get_downloader():
+    """Import youtube_downloader on first use, keeping it off the startup path."""
+    global _yd
+    if _yd is None:
+        import youtube_downloader
+        if not isinstance(youtube_downloader.logger, ContextLogger):
+            youtube_downloader.logger = ContextLogger(youtube_downloader.logger)
+        _yd = youtube_downloader
+    return _yd
+
+def load_title_cache():
+    """Load the video title cache from disk."""
+    if os.path.exists(TITLE_CACHE_FILE):
+        try:
+            with open(TITLE_CACHE_FILE, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error loading title cache: {e}")
+    return {}
+
+def prune_title_cache(cache):
+    """Return the cache without entries older than TITLE_CACHE_MAX_AGE."""
+    cutoff = time.time() - TITLE_CACHE_MAX_AGE
+    return {k: v for k, v in cache.items() if v.get('timestamp', 0) > cutoff}
+
+_title_cache_write_lock = threading.Lock()
+
+def save_title_cache(cache):
+    """Save the video title cache to disk atomically."""
+    # Write a temporary file and swap it in, so a crash or a concurrent
+    # write can never leave a truncated cache behind
+    tmp_file = TITLE_CACHE_FILE + ".tmp"
+    try:
+        with _title_cache_write_lock:
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps(cache))
+            os.replace(tmp_file, TITLE_CACHE_FILE)
+    except Exception as e:
+        print(f"Error saving to cache: {str(e)}")
+
+@lru_cache(maxsize=4096)
+def is_url(text):
+    """Memoized yd.is_url; the same table URLs are rechecked on every action."""
+    return get_downloader().is_url(text)
+
 class ProgressHandler(logging.Handler):
     """Custom logging handler that emits progress signals."""
     def __init__(self, signal):
@@ -78,11 +211,14 @@ class ProgressHandler(logging.Handler):
         self.signal = signal
     
     def emit(self, record):
-        self.signal.emit(self.format(record))
+        # Messages are emitted as-is, so skip the Formatter pipeline
+        self.signal.emit(record.getMessage())
 
 class DownloadWorker(QThread):
     """Worker thread for downloading videos."""
     progress = pyqtSignal(str)
+    # percent, downloaded, total, speed, ETA for each yt-dlp progress tick
+    progress_struct = pyqtSignal(int, str, str, str, str)
     finished = pyqtSignal(bool, str)
     
     def __init__(self, url, format_type, quality, output_folder, custom_title=None):
@@ -93,6 +229,19 @@ class DownloadWorker(QThread):
         self.output_folder = output_folder
         self.custom_title = custom_title
         self.is_cancelled = False
+        
+        # Resolve the format and output template up front so an invalid
+        # combination fails here rather than after the thread starts
+        self._format_spec = get_downloader().get_format_spec(format_type, quality)
+        
+        # Set output template based on custom title or default
+        if custom_title:
+            sanitized_title = custom_title.replace(' ', '_')
+            # Remove any characters that might cause issues
+            sanitized_title = ''.join(c for c in sanitized_title if c.isalnum() or c in '_-')
+            self._outtmpl = os.path.join(output_folder, f"{sanitized_title}.%(ext)s")
+        else:
+            self._outtmpl = os.path.join(output_folder, '%(title)s.%(ext)s')
     
     def run(self):
         """Main thread execution method."""
@@ -100,23 +249,25 @@ class DownloadWorker(QThread):
             return
             
         try:
+            import yt_dlp
+            yd = get_downloader()
+            
             # Create a custom logger for this thread
             thread_logger = logging.getLogger(f'download_thread_{id(self)}')
             thread_logger.setLevel(logging.INFO)
             
             # Add custom handler that emits progress signals
             handler = ProgressHandler(self.progress)
-            handler.setFormatter(logging.Formatter('%(message)s'))
             thread_logger.addHandler(handler)
             
-            # Temporarily replace the global logger
-            original_logger = yd.logger
-            yd.logger = thread_logger
+            # Route yd.logger calls made from this thread to our logger
+            _current_logger.set(thread_logger)
             
             # Configure yt-dlp options
             ydl_opts = {
-                'format': yd.get_format_spec(self.format_type, self.quality),
-                'progress_hooks': [lambda d: yd.handle_progress(d)],
+                'format': self._format_spec,
+                'outtmpl': self._outtmpl,
+                'progress_hooks': [lambda d: self.progress_hook(d, yd)],
                 'restrictfilenames': True,
                 'windowsfilenames': True,  # Also sanitize for Windows
                 'overwrites': True,  # Allow overwriting files
@@ -130,48 +281,84 @@ class DownloadWorker(QThread):
                 'ignoreerrors': False,
             }
             
-            # Set output template based on custom title or default
-            if self.custom_title:
-                sanitized_title = self.custom_title.replace(' ', '_')
-                # Remove any characters that might cause issues
-                sanitized_title = ''.join(c for c in sanitized_title if c.isalnum() or c in '_-')
-                ydl_opts['outtmpl'] = os.path.join(self.output_folder, f"{sanitized_title}.%(ext)s")
-            else:
-                ydl_opts['outtmpl'] = os.path.join(self.output_folder, '%(title)s.%(ext)s')
-            
             # Download the video
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([self.url])
             
-            # Restore the original logger
-            yd.logger = original_logger
-            
             if not self.is_cancelled:
                 self.finished.emit(True, "Download completed successfully!")
         except Exception as e:
             if not self.is_cancelled:
                 self.finished.emit(False, f"Error: {str(e)}")
     
+    def progress_hook(self, d, yd):
+        """Emit download ticks as structured data; pass other states to yd."""
+        if d.get('status') != 'downloading':
+            yd.handle_progress(d)
+            return
+        
+        from yt_dlp.utils import format_bytes
+        
+        downloaded = d.get('downloaded_bytes') or 0
+        total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+        percent = int(downloaded * 100 / total) if total else 0
+        speed = d.get('speed')
+        eta = d.get('eta')
+        
+        self.progress_struct.emit(
+            percent,
+            format_bytes(downloaded),
+            format_bytes(total) if total else "?",
+            f"{format_bytes(speed)}/s" if speed else "?",
+            f"{int(eta) // 60:02d}:{int(eta) % 60:02d}" if eta is not None else "?",
+        )
+    
     def cancel(self):
         """Mark the thread as cancelled to prevent further processing."""
         self.is_cancelled = True
 
-class TranscriptWorker(QThread):
-    """Worker thread for generating transcripts."""
-    progress = pyqtSignal(str)
+class BatchedProgressWorker(QThread):
+    """Worker thread that coalesces progress messages into batched signals."""
+    progress = pyqtSignal(list)
     finished = pyqtSignal(bool, str)
     
+    # Flush once this many messages are pending or this much time has passed
+    FLUSH_COUNT = 8
+    FLUSH_INTERVAL = 0.05
+    
+    def __init__(self):
+        super().__init__()
+        self._pending = []
+        self._last_flush = time.monotonic()
+    
+    def _emit(self, message, flush=False):
+        """Queue a progress message, flushing when the batch is due."""
+        self._pending.append(message)
+        if (flush or len(self._pending) >= self.FLUSH_COUNT
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+            self._flush_progress()
+    
+    def _flush_progress(self):
+        """Emit all pending progress messages as a single signal."""
+        if self._pending:
+            self.progress.emit(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+class TranscriptWorker(BatchedProgressWorker):
+    """Worker thread for generating transcripts."""
+    
     def __init__(self, urls, output_folder=None):
         super().__init__()
-        self.urls = urls
+        # Drop duplicate URLs, keeping the order they were entered in
+        self.urls = list(dict.fromkeys(urls))
         self.output_folder = output_folder
         self.is_cancelled = False
     
     def format_timestamp(self, seconds):
         """Convert seconds to HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        seconds = int(seconds % 60)
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         return f"{minutes:02d}:{seconds:02d}"
@@ -262,16 +449,16 @@ class TranscriptWorker(QThread):
                     break
                     
                 try:
-                    self.progress.emit(f"Getting transcript for {url}")
+                    self._emit(f"Getting transcript for {url}")
                     video_id = yt_sum.extract_video_id(url)
                     if not video_id:
-                        self.progress.emit(f"❌ Error: Could not extract video ID from URL: {url}")
-                        self.progress.emit("---")
+                        self._emit(f"❌ Error: Could not extract video ID from URL: {url}")
+                        self._emit("---", flush=True)
                         continue
                         
                     # Get video title
                     video_title = yt_sum.get_video_title(video_id)
-                    self.progress.emit(f"Processing transcript for: {video_title}")
+                    self._emit(f"Processing transcript for: {video_title}", flush=True)
                     
                     # Get the transcript
                     transcript = yt_sum.YouTubeTranscriptApi.get_transcript(video_id)
@@ -290,22 +477,23 @@ class TranscriptWorker(QThread):
                     transcript_file = yt_sum.get_next_available_filename(base_transcript_file, ".txt")
                     
                     # Save the transcript
-                    with open(transcript_file, 'w', encoding='utf-8') as f:
+                    with open(transcript_file, 'w', encoding='utf-8', buffering=65536) as f:
                         f.write(formatted_transcript)
                     
                     # Update progress with success message
-                    self.progress.emit(f"✓ Transcript saved to: {transcript_file}")
-                    self.progress.emit("---")
+                    self._emit(f"✓ Transcript saved to: {transcript_file}")
+                    self._emit("---", flush=True)
                     
                 except Exception as e:
-                    self.progress.emit(f"❌ Error processing {url}: {str(e)}")
-                    self.progress.emit("---")
+                    self._emit(f"❌ Error processing {url}: {str(e)}")
+                    self._emit("---", flush=True)
             
             if not self.is_cancelled:
-                self.progress.emit("✨ Transcript generation completed!")
+                self._emit("✨ Transcript generation completed!", flush=True)
                 self.finished.emit(True, "All transcripts processed successfully!")
                 
         except Exception as e:
+            self._flush_progress()
             if not self.is_cancelled:
                 self.finished.emit(False, f"Error: {str(e)}")
     
@@ -313,14 +501,13 @@ class TranscriptWorker(QThread):
         """Mark the thread as cancelled to prevent further processing."""
         self.is_cancelled = True
 
-class SummaryWorker(QThread):
+class SummaryWorker(BatchedProgressWorker):
     """Worker thread for generating summaries."""
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)
     
     def __init__(self, urls, output_folder, depth, model):
         super().__init__()
-        self.urls = urls
+        # Drop duplicate URLs, keeping the order they were entered in
+        self.urls = list(dict.fromkeys(urls))
         self.output_folder = output_folder
         self.is_cancelled = False
         self.depth = depth
@@ -338,16 +525,16 @@ class SummaryWorker(QThread):
                     break
                 
                 try:
-                    self.progress.emit(f"Getting video information for {url}")
+                    self._emit(f"Getting video information for {url}")
                     video_id = yt_sum.extract_video_id(url)
                     if not video_id:
-                        self.progress.emit(f"❌ Error: Could not extract video ID from URL: {url}")
-                        self.progress.emit("---")
+                        self._emit(f"❌ Error: Could not extract video ID from URL: {url}")
+                        self._emit("---", flush=True)
                         continue
                     
                     # Get video title
                     video_title = yt_sum.get_video_title(video_id)
-                    self.progress.emit(f"Processing video: {video_title}")
+                    self._emit(f"Processing video: {video_title}")
                     
                     # Store the original get_next_available_filename function
                     original_get_filename = yt_sum.get_next_available_filename
@@ -361,42 +548,43 @@ class SummaryWorker(QThread):
                     yt_sum.get_next_available_filename = underscore_filename_wrapper
                     
                     # First get the transcript
-                    self.progress.emit(f"📝 Generating transcript...")
+                    self._emit(f"📝 Generating transcript...", flush=True)
                     transcript_file, transcript_text = yt_sum.get_transcript(url, output_dir=self.output_folder)
                     if not transcript_file or not transcript_text:
-                        self.progress.emit(f"❌ Error: Could not get transcript for {url}")
-                        self.progress.emit("---")
+                        self._emit(f"❌ Error: Could not get transcript for {url}")
+                        self._emit("---", flush=True)
                         continue
-                    self.progress.emit(f"✓ Transcript saved to: {transcript_file}")
+                    self._emit(f"✓ Transcript saved to: {transcript_file}")
                     
                     # Now generate the summary with the selected depth
-                    self.progress.emit(f"🤖 Generating AI summary (Depth: {self.depth.value.capitalize()}, Model: {self.model})...")
+                    self._emit(f"🤖 Generating AI summary (Depth: {self.depth.value.capitalize()}, Model: {self.model})...", flush=True)
                     summary = yt_sum.generate_summary(transcript_text, depth=self.depth, model=self.model)
                     if summary:
                         # Add the title at the beginning of the summary
                         summary_with_title = f"# {video_title}\n\n{summary}"
                         base_summary_file = f"{video_title} - summary"
                         summary_file = yt_sum.get_next_available_filename(base_summary_file, ".md", self.output_folder)
-                        with open(summary_file, 'w', encoding='utf-8') as f:
+                        with open(summary_file, 'w', encoding='utf-8', buffering=65536) as f:
                             f.write(summary_with_title)
-                        self.progress.emit(f"✓ Summary saved to: {summary_file}")
+                        self._emit(f"✓ Summary saved to: {summary_file}")
                     else:
-                        self.progress.emit(f"❌ Error: Could not generate summary for {url}")
+                        self._emit(f"❌ Error: Could not generate summary for {url}")
                     
                     # Restore the original function
                     yt_sum.get_next_available_filename = original_get_filename
                     
-                    self.progress.emit("---")
+                    self._emit("---", flush=True)
                     
                 except Exception as e:
-                    self.progress.emit(f"❌ Error processing {url}: {str(e)}")
-                    self.progress.emit("---")
+                    self._emit(f"❌ Error processing {url}: {str(e)}")
+                    self._emit("---", flush=True)
             
             if not self.is_cancelled:
-                self.progress.emit("✨ Summary generation completed!")
+                self._emit("✨ Summary generation completed!", flush=True)
                 self.finished.emit(True, "All summaries processed successfully!")
                 
         except Exception as e:
+            self._flush_progress()
             if not self.is_cancelled:
                 self.finished.emit(False, f"Error: {str(e)}")
     
@@ -407,6 +595,8 @@ class SummaryWorker(QThread):
 class YouTubeDownloaderGUI(QMainWindow):
     # Define a custom signal for updating the title cell
     update_title_signal = pyqtSignal(int, str)
+    # Progress messages from title fetch threads, delivered on the GUI thread
+    title_progress_signal = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
@@ -414,6 +604,35 @@ class YouTubeDownloaderGUI(QMainWindow):
         # Load configuration
         self.config = load_config()
         
+        # Coalesce config writes: handlers mark the config dirty and a
+        # single-shot timer writes it once changes settle
+        self._config_dirty = False
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(500)
+        self._config_timer.timeout.connect(self.flush_config)
+        
+        # Load the title cache once; fetch threads share it under a lock and a
+        # timer writes it back when new titles have been added
+        # Expired entries are dropped here, and the file is only rewritten
+        # if that actually removed something
+        cache = load_title_cache()
+        self._title_cache = prune_title_cache(cache)
+        self._title_cache_lock = threading.Lock()
+        self._title_cache_dirty = len(self._title_cache) != len(cache)
+        self._title_cache_timer = QTimer(self)
+        self._title_cache_timer.setInterval(5000)
+        self._title_cache_timer.timeout.connect(self.flush_title_cache)
+        self._title_cache_timer.start()
+        
+        # Buffer progress text lines and append them in one go so bursts of
+        # messages cost a single layout and repaint
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self.flush_log)
+        
         # Set window properties from config
         self.setWindowTitle("YouTube Extractor")
         self.resize(self.config.get("window_width", 900), self.config.get("window_height", 700))
@@ -424,6 +643,7 @@ class YouTubeDownloaderGUI(QMainWindow):
         
         # Connect the update title signal to the slot
         self.update_title_signal.connect(self.update_title_cell)
+        self.title_progress_signal.connect(self.update_progress)
         
         # Initialize UI components
         self.setup_ui()
@@ -434,13 +654,29 @@ class YouTubeDownloaderGUI(QMainWindow):
         # Apply theme
         self.apply_theme(self.config.get("theme", "matrix"))
         
+        # Resolve YouTube hosts ahead of the first request
+        prewarm_dns()
+        
         # Initialize thread-related attributes
+        self.max_worker_threads = get_max_worker_threads()
+        self._title_pool = ThreadPoolExecutor(max_workers=self.max_worker_threads,
+                                              thread_name_prefix="title")
+        self._title_ydl_local = threading.local()
+        self._title_ydls = []
         self.download_thread = None
         self.running_threads = []
         self.current_urls = []
         
         # Flag to prevent recursive cell change events
         self.is_updating_cell = False
+        
+        # Every URL row above this index is filled in
+        self._next_empty_row = 0
+        
+        # Index of which row holds each URL, and the reverse, so status and
+        # title lookups don't scan the table
+        self._url_to_row = {}
+        self._row_to_url = {}
     
     def setup_menu(self):
         """Set up the application menu bar."""
@@ -471,7 +707,7 @@ class YouTubeDownloaderGUI(QMainWindow):
             theme_action = QAction(theme_name.capitalize(), self)
             theme_action.setCheckable(True)
             theme_action.setChecked(self.config.get("theme") == theme_name)
-            theme_action.triggered.connect(lambda checked, tn=theme_name: self.apply_theme(tn))
+            theme_action.triggered.connect(partial(self.apply_theme, theme_name))
             theme_menu.addAction(theme_action)
         
         settings_menu.addMenu(theme_menu)
@@ -593,19 +829,47 @@ class YouTubeDownloaderGUI(QMainWindow):
         text = clipboard.text()
         
         if text and row >= 0:
-            # If the current row already has content, find the first empty row
-            if self.url_table.item(row, 0) and self.url_table.item(row, 0).text().strip():
-                for r in range(self.url_table.rowCount()):
-                    if not self.url_table.item(r, 0) or not self.url_table.item(r, 0).text().strip():
-                        row = r
-                        break
-                else:
-                    # If no empty row found, add a new one
-                    self.url_table.setRowCount(self.url_table.rowCount() + 1)
-                    row = self.url_table.rowCount() - 1
+            # Multi-line pastes put one URL per row
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
             
-            # Set the text in the cell
-            self.url_table.setItem(row, column, QTableWidgetItem(text))
+            # Set all cells with signals and repaints suspended
+            pasted_rows = []
+            self.url_table.setUpdatesEnabled(False)
+            self.url_table.blockSignals(True)
+            try:
+                for line in lines:
+                    # If the row already has content, use the first empty row
+                    if self.url_table.item(row, 0) and self.url_table.item(row, 0).text().strip():
+                        row = self.next_empty_row()
+                    self.url_table.setItem(row, column, QTableWidgetItem(line))
+                    pasted_rows.append(row)
+            finally:
+                self.url_table.blockSignals(False)
+                self.url_table.setUpdatesEnabled(True)
+                self.url_table.viewport().update()
+            
+            # Fetch titles for the pasted rows
+            for pasted_row in pasted_rows:
+                self.on_cell_changed(pasted_row, column)
+    
+    def advance_empty_row_cursor(self):
+        """Move the next-empty-row cursor past any rows that now have a URL."""
+        row = self._next_empty_row
+        while row < self.url_table.rowCount():
+            item = self.url_table.item(row, 0)
+            if not item or not item.text().strip():
+                break
+            row += 1
+        self._next_empty_row = row
+    
+    def next_empty_row(self):
+        """Return the first row with an empty URL cell, adding one if needed."""
+        self.advance_empty_row_cursor()
+        
+        # If no empty row found, add a new one
+        if self._next_empty_row >= self.url_table.rowCount():
+            self.url_table.setRowCount(self._next_empty_row + 1)
+        return self._next_empty_row
     
     def setup_options(self, main_layout):
         """Set up the options section with format, quality, and output folder selection."""
@@ -663,17 +927,11 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.depth_combo = QComboBox()
         self.depth_combo.setMinimumHeight(30)
         self.depth_combo.setMinimumWidth(120)
-        self.depth_combo.addItems([depth.value.capitalize() for depth in SummaryDepth])
-        
-        # Set the last used depth if available
-        last_depth = self.config.get("last_depth", SummaryDepth.DETAILED.value)
-        depth_index = self.depth_combo.findText(last_depth.capitalize())
-        if depth_index >= 0:
-            self.depth_combo.setCurrentIndex(depth_index)
-        
-        # Connect depth change to save config
-        self.depth_combo.currentTextChanged.connect(self.save_depth_preference)
         depth_layout.addWidget(self.depth_combo)
+        
+        # Fill the depth options once the event loop starts, so importing the
+        # summarizer doesn't delay the first paint of the window
+        QTimer.singleShot(0, self.populate_depth_combo)
         options_layout.addLayout(depth_layout)
         
         # Output folder selection
@@ -699,6 +957,20 @@ class YouTubeDownloaderGUI(QMainWindow):
         
         main_layout.addLayout(options_layout)
     
+    def populate_depth_combo(self):
+        """Fill the summary depth combo box from SummaryDepth."""
+        from ytsummarator import SummaryDepth
+        self.depth_combo.addItems([depth.value.capitalize() for depth in SummaryDepth])
+        
+        # Set the last used depth if available
+        last_depth = self.config.get("last_depth", SummaryDepth.DETAILED.value)
+        depth_index = self.depth_combo.findText(last_depth.capitalize())
+        if depth_index >= 0:
+            self.depth_combo.setCurrentIndex(depth_index)
+        
+        # Connect depth change to save config
+        self.depth_combo.currentTextChanged.connect(self.save_depth_preference)
+    
     def setup_action_buttons(self, main_layout):
         """Set up the action buttons section."""
         action_layout = QHBoxLayout()
@@ -791,7 +1063,7 @@ class YouTubeDownloaderGUI(QMainWindow):
         progress_group.setLayout(progress_layout)
         main_layout.addWidget(progress_group)
     
-    def apply_theme(self, theme_name):
+    def apply_theme(self, theme_name, checked=False):
         """Apply the selected theme to the application."""
         # Update theme in all theme actions
         theme_menu = self.findChild(QMenu, "ThemeMenu")
@@ -808,27 +1080,38 @@ class YouTubeDownloaderGUI(QMainWindow):
         
         # Save the theme preference
         self.config["theme"] = theme_name
-        save_config(self.config)
+        self.schedule_config_save()
+    
+    def schedule_config_save(self):
+        """Mark the config dirty and write it once changes settle."""
+        self._config_dirty = True
+        self._config_timer.start()
+    
+    def flush_config(self):
+        """Write the config to disk if it has unsaved changes."""
+        if self._config_dirty:
+            self._config_dirty = False
+            save_config(self.config)
     
     def save_format_preference(self, format_type):
         """Save the selected format to config."""
         self.config["last_format"] = format_type
-        save_config(self.config)
+        self.schedule_config_save()
     
     def save_quality_preference(self, quality):
         """Save the selected quality to config."""
         self.config["last_quality"] = quality
-        save_config(self.config)
+        self.schedule_config_save()
     
     def save_depth_preference(self, depth):
         """Save the selected summary depth to config."""
         self.config["last_depth"] = depth.lower()
-        save_config(self.config)
+        self.schedule_config_save()
     
     def save_model_preference(self, model):
         """Save the selected model to config."""
         self.config["last_model"] = model
-        save_config(self.config)
+        self.schedule_config_save()
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events for files."""
@@ -851,26 +1134,45 @@ class YouTubeDownloaderGUI(QMainWindow):
     def load_urls_from_file(self, file_path):
         """Load URLs from a text file into the table."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip() and yd.is_url(line.strip())]
+            # Scan the memory-mapped file for URLs in one regex pass
+            urls = []
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        urls = [match.group(0).decode('utf-8', 'replace')
+                                for match in URL_PATTERN.finditer(mm)]
+            urls = [url for url in urls if is_url(url)]
             
             if not urls:
                 self.update_progress("No valid YouTube URLs found in the file")
                 return
             
-            # Clear existing URLs
-            for row in range(self.url_table.rowCount()):
-                self.url_table.setItem(row, 0, None)
-                self.url_table.setItem(row, 1, None)
-                self.url_table.setItem(row, 2, None)  # Clear status
+            # Replace the table contents with signals and repaints suspended
+            self.url_table.setUpdatesEnabled(False)
+            self.url_table.blockSignals(True)
+            try:
+                # Clear existing URLs by dropping all rows, then size the table
+                # once, keeping at least as many rows as before
+                row_count = max(len(urls), self.url_table.rowCount())
+                self.url_table.setRowCount(0)
+                self.url_table.setRowCount(row_count)
+                
+                # Add new URLs
+                for i, url in enumerate(urls):
+                    self.url_table.setItem(i, 0, QTableWidgetItem(url))
+                    self.url_table.setItem(i, 2, QTableWidgetItem("Pending"))  # Set initial status
+            finally:
+                self.url_table.blockSignals(False)
+                self.url_table.setUpdatesEnabled(True)
+                self.url_table.viewport().update()
+            
+            self._next_empty_row = 0
+            self._url_to_row.clear()
+            self._row_to_url.clear()
             
-            # Add new URLs
-            for i, url in enumerate(urls):
-                if i >= self.url_table.rowCount():
-                    self.url_table.setRowCount(i + 1)
-                self.url_table.setItem(i, 0, QTableWidgetItem(url))
-                self.url_table.setItem(i, 2, QTableWidgetItem("Pending"))  # Set initial status
-                # Titles will be fetched automatically by the cell changed event
+            # Fetch titles now that the cell changed events were suppressed
+            for i in range(len(urls)):
+                self.on_cell_changed(i, 0)
             
             self.update_progress(f"Loaded {len(urls)} URLs from {os.path.basename(file_path)}")
         except Exception as e:
@@ -885,7 +1187,23 @@ class YouTubeDownloaderGUI(QMainWindow):
         
         try:
             url_item = self.url_table.item(row, 0)
-            if url_item and yd.is_url(url := url_item.text().strip()):
+            previous_url = self._row_to_url.get(row)
+            
+            # Keep the URL index and next-empty-row cursor in step with edits
+            self.index_url_row(row, url_item.text().strip() if url_item else "")
+            if url_item and url_item.text().strip():
+                if row == self._next_empty_row:
+                    self.advance_empty_row_cursor()
+            elif row < self._next_empty_row:
+                self._next_empty_row = row
+            
+            if url_item and is_url(url := url_item.text().strip()):
+                # Re-committing the same URL keeps the title already shown
+                title_item = self.url_table.item(row, 1)
+                if (url == previous_url and title_item
+                        and title_item.text().strip() not in ("", "Error", "Unavailable")):
+                    return
+                
                 self.update_progress(f"Fetching title for {url}...")
                 
                 # Create a thread to fetch the video title
@@ -893,79 +1211,104 @@ class YouTubeDownloaderGUI(QMainWindow):
         finally:
             self.is_updating_cell = False
     
+    def index_url_row(self, row, url):
+        """Record that row now holds url, forgetting the URL it held before."""
+        old_url = self._row_to_url.pop(row, None)
+        if old_url is not None and self._url_to_row.get(old_url) == row:
+            del self._url_to_row[old_url]
+        if url:
+            self._row_to_url[row] = url
+            # Like the old table scan, the first row with a URL wins
+            self._url_to_row.setdefault(url, row)
+    
     def fetch_video_title(self, row, url):
-        """Fetch the video title in a separate thread with caching."""
+        """Fetch the video title on the title thread pool with caching."""
         def fetch_title():
             try:
-                # Check cache first
-                cache_file = os.path.join(os.path.expanduser("~"), ".youtube_extractor_cache.json")
-                cache = {}
-                if os.path.exists(cache_file):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            cache = json.load(f)
-                    except json.JSONDecodeError:
-                        pass
+                yd = get_downloader()
 
                 video_id = yd.extract_video_id(url)
                 if not video_id:
-                    self.update_progress(f"❌ Invalid YouTube URL format: {url}")
+                    self.title_progress_signal.emit(f"❌ Invalid YouTube URL format: {url}")
                     self.update_title_signal.emit(row, "Invalid URL")
                     return
 
                 # Check cache for this video ID
-                if video_id in cache and time.time() - cache[video_id]['timestamp'] < 86400:  # 24 hour cache
-                    self.update_title_signal.emit(row, cache[video_id]['title'])
+                with self._title_cache_lock:
+                    cached = self._title_cache.get(video_id)
+                if cached and time.time() - cached['timestamp'] < 86400:  # 24 hour cache
+                    self.update_title_signal.emit(row, cached['title'])
                     return
 
                 # Fetch from YouTube if not in cache
-                ydl_opts = {
-                    'quiet': True,
-                    'no_warnings': True,
-                    'extract_flat': True,
-                    'ignoreerrors': True,
-                    'no_color': True,
-                }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    try:
-                        info = ydl.extract_info(url, download=False)
-                        if info is None:
-                            self.update_progress(f"❌ Could not fetch video info: {url}")
-                            self.update_title_signal.emit(row, "Unavailable")
-                            return
-                        
-                        title = info.get('title', 'Unknown Title')
-                        
-                        # Update cache
-                        cache[video_id] = {
+                ydl = self.get_title_ydl()
+                try:
+                    info = ydl.extract_info(url, download=False)
+                    if info is None:
+                        self.title_progress_signal.emit(f"❌ Could not fetch video info: {url}")
+                        self.update_title_signal.emit(row, "Unavailable")
+                        return
+                    
+                    title = info.get('title', 'Unknown Title')
+                    
+                    # Update cache; it is written to disk by flush_title_cache
+                    with self._title_cache_lock:
+                        self._title_cache[video_id] = {
                             'title': title,
                             'timestamp': time.time()
                         }
-                        try:
-                            with open(cache_file, 'w') as f:
-                                json.dump(cache, f)
-                        except Exception as e:
-                            print(f"Error saving to cache: {str(e)}")
-                        
-                        # Update the title cell in the main thread
-                        self.update_title_signal.emit(row, title)
-                    except Exception as e:
-                        self.update_progress(f"❌ Error fetching title: {str(e)}")
-                        self.update_title_signal.emit(row, "Error")
+                        self._title_cache_dirty = True
+                    
+                    # Update the title cell in the main thread
+                    self.update_title_signal.emit(row, title)
+                except Exception as e:
+                    self.title_progress_signal.emit(f"❌ Error fetching title: {str(e)}")
+                    self.update_title_signal.emit(row, "Error")
             except Exception as e:
-                self.update_progress(f"❌ Error processing URL: {str(e)}")
+                self.title_progress_signal.emit(f"❌ Error processing URL: {str(e)}")
                 self.update_title_signal.emit(row, "Error")
-            finally:
-                # Remove thread from tracking list when done
-                if thread in self.running_threads:
-                    self.running_threads.remove(thread)
         
-        thread = threading.Thread(target=fetch_title)
-        thread.daemon = True
-        # Add thread to tracking list
-        self.running_threads.append(thread)
-        thread.start()
+        # Run on the shared pool so a large paste doesn't start a thread per URL
+        self._title_pool.submit(fetch_title)
+    
+    def get_title_ydl(self):
+        """Return the calling pool thread's YoutubeDL, creating it on first use."""
+        # YoutubeDL isn't safe to share between threads, so each title thread
+        # keeps one and reuses its extractors and HTTP session across fetches
+        ydl = getattr(self._title_ydl_local, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': True,
+                'ignoreerrors': True,
+                'no_color': True,
+                'socket_timeout': 10,
+            })
+            self._title_ydl_local.ydl = ydl
+            self._title_ydls.append(ydl)
+        return ydl
+    
+    def finish_title_fetches(self):
+        """Wait for running title fetches, then close their extractors and save their titles."""
+        self._title_pool.shutdown(wait=True)
+        for ydl in self._title_ydls:
+            try:
+                ydl.close()
+            except Exception as e:
+                print(f"Error closing title extractor: {e}")
+        self._title_ydls.clear()
+        self.flush_title_cache()
+    
+    def flush_title_cache(self):
+        """Write the title cache to disk if new titles were fetched."""
+        with self._title_cache_lock:
+            if not self._title_cache_dirty:
+                return
+            self._title_cache_dirty = False
+            cache = dict(self._title_cache)
+        save_title_cache(cache)
     
     @pyqtSlot(int, str)
     def update_title_cell(self, row, title):
@@ -984,23 +1327,10 @@ class YouTubeDownloaderGUI(QMainWindow):
             self.output_folder_input.setText(folder)
             # Save the selected folder to config
             self.config["last_output_folder"] = folder
-            save_config(self.config)
+            self.schedule_config_save()
     
     def update_progress(self, message):
         """Update progress text and progress bar."""
-        # Function to strip ANSI color codes and other control sequences
-        def clean_text(text):
-            import re
-            # Pattern matches all ANSI escape sequences
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            # First remove ANSI escape sequences
-            text = ansi_escape.sub('', text)
-            # Replace other problematic characters
-            text = text.replace('\x1b', '').replace('\r', '').replace('\x08', '')
-            # Remove any other control characters except newline
-            text = ''.join(char for char in text if char == '\n' or ord(char) >= 32)
-            return text
-
         # Clean the message before processing
         clean_message = clean_text(message)
         
@@ -1054,21 +1384,57 @@ class YouTubeDownloaderGUI(QMainWindow):
             self.progress_bar.setFormat("100% - Complete")
         
         # Only add non-progress messages to the text area
-        if not any(x in clean_message for x in ["Downloading:", "ETA:", "Speed:", "%"]):
-            self.progress_text.append(clean_message)
-            # Auto-scroll to the bottom
-            scrollbar = self.progress_text.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+        if PROGRESS_PATTERN.search(clean_message) is None:
+            self.append_log(clean_message)
+    
+    def update_download_progress(self, percent, downloaded_size, total_size, speed, eta):
+        """Update the progress bar from a structured download progress tick."""
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"{percent}% - {downloaded_size}/{total_size} - {speed} - ETA: {eta}")
+    
+    def update_progress_batch(self, messages):
+        """Append a batch of worker messages to the progress text in one update."""
+        lines = [clean_text(message) for message in messages]
+        
+        if any("completed" in line.lower() for line in lines):
+            self.progress_bar.setValue(100)
+            self.progress_bar.setFormat("100% - Complete")
+        
+        # Only add non-progress messages to the text area
+        lines = [line for line in lines if PROGRESS_PATTERN.search(line) is None]
+        if lines:
+            self.append_log("\n".join(lines))
+    
+    def append_log(self, text):
+        """Queue text for the progress area; flush_log appends it shortly."""
+        self._log_buffer.append(text)
+        # Don't restart a running timer, or a steady stream would never flush
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def flush_log(self):
+        """Append all buffered progress text in a single update."""
+        if not self._log_buffer:
+            return
+        self.progress_text.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        # Auto-scroll to the bottom
+        scrollbar = self.progress_text.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+    
+    def clear_log(self):
+        """Clear the progress area, dropping any text still buffered."""
+        self._log_timer.stop()
+        self._log_buffer.clear()
+        self.progress_text.clear()
     
     def update_row_status(self, url, status, color="#00FF41"):
         """Update the status column for a given URL."""
-        for row in range(self.url_table.rowCount()):
-            url_item = self.url_table.item(row, 0)
-            if url_item and url_item.text().strip() == url:
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(Qt.GlobalColor.red if "Error" in status else Qt.GlobalColor.green)
-                self.url_table.setItem(row, 2, status_item)
-                break
+        row = self._url_to_row.get(url)
+        if row is not None:
+            status_item = QTableWidgetItem(status)
+            status_item.setForeground(Qt.GlobalColor.red if "Error" in status else Qt.GlobalColor.green)
+            self.url_table.setItem(row, 2, status_item)
     
     def download_finished(self, success, message, url):
         """Handle download completion."""
@@ -1091,16 +1457,12 @@ class YouTubeDownloaderGUI(QMainWindow):
     
     def get_urls_from_table(self):
         """Get all valid URLs from the table."""
-        urls = []
-        for row in range(self.url_table.rowCount()):
-            item = self.url_table.item(row, 0)
-            if item and yd.is_url(item := item.text().strip()):
-                urls.append(item)
-        return urls
+        # _row_to_url mirrors the URL column, so read it instead of the table
+        return [url for _, url in sorted(self._row_to_url.items()) if is_url(url)]
     
     def start_download(self):
         """Start the download process."""
-        self.progress_text.clear()
+        self.clear_log()
         urls = self.get_urls_from_table()
 
         if not urls:
@@ -1112,8 +1474,8 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.transcript_button.setEnabled(False)
         self.summary_button.setEnabled(False)
         
-        # Initialize the list of URLs to process
-        self.current_urls = urls.copy()
+        # Initialize the list of URLs to process, skipping duplicates
+        self.current_urls = list(dict.fromkeys(urls))
         if self.current_urls:
             # Start with the first URL
             self.download_single(self.current_urls.pop(0))
@@ -1123,15 +1485,16 @@ class YouTubeDownloaderGUI(QMainWindow):
             self.transcript_button.setEnabled(True)
             self.summary_button.setEnabled(True)
     
-    def handle_network_error(self, error, retry_count=0, max_retries=3):
-        """Handle network-related errors with retry logic."""
+    def handle_network_error(self, error, retry, retry_count=0, max_retries=3):
+        """Handle network-related errors by scheduling retry after a backoff."""
         if retry_count >= max_retries:
             self.update_progress(f"❌ Network error after {max_retries} retries: {str(error)}")
             return False
 
         wait_time = 2 ** retry_count  # Exponential backoff
         self.update_progress(f"Network error occurred. Retrying in {wait_time} seconds...")
-        time.sleep(wait_time)
+        # Wait on the event loop rather than sleeping, so the UI stays responsive
+        QTimer.singleShot(wait_time * 1000, retry)
         return True
 
     def is_network_error(self, error):
@@ -1179,41 +1542,40 @@ class YouTubeDownloaderGUI(QMainWindow):
 
         # Find the custom title if available
         custom_title = None
-        for row in range(self.url_table.rowCount()):
-            url_item = self.url_table.item(row, 0)
-            if url_item and url_item.text().strip() == url:
-                title_item = self.url_table.item(row, 1)
-                if title_item and title_item.text().strip():
-                    custom_title = title_item.text().strip()
-                break
+        row = self._url_to_row.get(url)
+        if row is not None:
+            title_item = self.url_table.item(row, 1)
+            if title_item and title_item.text().strip():
+                custom_title = title_item.text().strip()
 
-        retry_count = 0
-        max_retries = 3
-        while retry_count <= max_retries:
-            try:
-                self.update_progress(f"Starting download for: {url}")
-                
-                # Create a new download worker with the custom title
-                self.download_thread = DownloadWorker(url, format_type, quality, output_folder, custom_title)
-                self.download_thread.progress.connect(self.update_progress)
-                self.download_thread.finished.connect(lambda success, msg: self.download_finished(success, msg, url))
-                self.download_thread.start()
-                return
-                
-            except Exception as e:
-                if self.is_network_error(e):
-                    if not self.handle_network_error(e, retry_count, max_retries):
-                        self.update_row_status(url, "❌ Network Error")
-                        break
-                    retry_count += 1
-                else:
-                    self.update_progress(f"❌ Error: {str(e)}")
-                    self.update_row_status(url, "❌ Error")
-                    break
+        self.download_single_attempt(url, format_type, quality, output_folder, custom_title)
+    
+    def download_single_attempt(self, url, format_type, quality, output_folder,
+                                custom_title, retry_count=0, max_retries=3):
+        """Start a download worker, rescheduling itself on network errors."""
+        try:
+            self.update_progress(f"Starting download for: {url}")
+            
+            # Create a new download worker with the custom title
+            self.download_thread = DownloadWorker(url, format_type, quality, output_folder, custom_title)
+            self.download_thread.progress.connect(self.update_progress)
+            self.download_thread.progress_struct.connect(self.update_download_progress)
+            self.download_thread.finished.connect(lambda success, msg: self.download_finished(success, msg, url))
+            self.download_thread.start()
+            
+        except Exception as e:
+            if self.is_network_error(e):
+                retry = partial(self.download_single_attempt, url, format_type, quality,
+                                output_folder, custom_title, retry_count + 1, max_retries)
+                if not self.handle_network_error(e, retry, retry_count, max_retries):
+                    self.update_row_status(url, "❌ Network Error")
+            else:
+                self.update_progress(f"❌ Error: {str(e)}")
+                self.update_row_status(url, "❌ Error")
         
     def save_transcripts(self):
         """Save transcripts for videos in the table."""
-        self.progress_text.clear()
+        self.clear_log()
         urls = self.get_urls_from_table()
 
         if not urls:
@@ -1233,7 +1595,7 @@ class YouTubeDownloaderGUI(QMainWindow):
         
         # Create and start the transcript worker thread with output folder
         self.transcript_thread = TranscriptWorker(urls, output_folder)
-        self.transcript_thread.progress.connect(self.update_progress)
+        self.transcript_thread.progress.connect(self.update_progress_batch)
         self.transcript_thread.finished.connect(self.transcript_finished)
         self.transcript_thread.start()
     
@@ -1262,12 +1624,13 @@ class YouTubeDownloaderGUI(QMainWindow):
             return
         
         # Get the current depth and model settings
+        from ytsummarator import SummaryDepth
         depth = SummaryDepth(self.depth_combo.currentText().lower())
         model = self.model_combo.currentText()
         
         # Create and start the summary thread
         self.summary_thread = SummaryWorker(urls, output_folder, depth, model)
-        self.summary_thread.progress.connect(self.update_progress)
+        self.summary_thread.progress.connect(self.update_progress_batch)
         self.summary_thread.finished.connect(self.summary_finished)
         self.running_threads.append(self.summary_thread)
         self.summary_thread.start()
@@ -1291,38 +1654,27 @@ class YouTubeDownloaderGUI(QMainWindow):
     
     def resizeEvent(self, event):
         """Handle window resize event to save window size."""
+        # Only mark the config dirty; closeEvent writes it out once
         self.config["window_width"] = self.width()
         self.config["window_height"] = self.height()
-        save_config(self.config)
+        self._config_dirty = True
         super().resizeEvent(event)
 
     def cleanup_resources(self):
         """Clean up resources and temporary files."""
         try:
             # Clear progress text to free memory
-            self.progress_text.clear()
+            self.clear_log()
             
             # Clear table items
             self.url_table.clearContents()
+            self._next_empty_row = 0
+            self._url_to_row.clear()
+            self._row_to_url.clear()
             
-            # Clear cache if it's too old
-            cache_file = os.path.join(os.path.expanduser("~"), ".youtube_extractor_cache.json")
-            if os.path.exists(cache_file):
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache = json.load(f)
-                    # Remove entries older than 7 days
-                    current_time = time.time()
-                    cache = {k: v for k, v in cache.items() 
-                            if current_time - v['timestamp'] < 604800}  # 7 days
-                    with open(cache_file, 'w') as f:
-                        json.dump(cache, f)
-                except Exception as e:
-                    print(f"Error cleaning cache: {str(e)}")
-
-            # Force garbage collection
-            import gc
-            gc.collect()
+            # closeEvent writes the title cache once the running fetches,
+            # which may still add titles, have finished
+            self._title_cache_timer.stop()
 
         except Exception as e:
             print(f"Error during cleanup: {str(e)}")
@@ -1333,7 +1685,11 @@ class YouTubeDownloaderGUI(QMainWindow):
         output_folder = self.output_folder_input.text()
         if output_folder:
             self.config["last_output_folder"] = output_folder
-            save_config(self.config)
+            self._config_dirty = True
+        
+        # Write any pending config changes now rather than waiting for the timer
+        self._config_timer.stop()
+        self.flush_config()
         
         # Clean up resources
         self.cleanup_resources()
@@ -1362,12 +1718,18 @@ class YouTubeDownloaderGUI(QMainWindow):
             except Exception as e:
                 print(f"Error terminating download thread: {e}")
         
+        # Drop queued title fetches. A running one can take several requests
+        # of up to socket_timeout each, so the close doesn't wait for them here
+        self._title_pool.shutdown(wait=False, cancel_futures=True)
+        # Non-daemon, so the interpreter still waits for it on exit
+        threading.Thread(target=self.finish_title_fetches, name="title-shutdown").start()
+        
         # For other running threads, try to stop them gracefully
         remaining_threads = self.running_threads.copy()  # Make a copy to avoid modification during iteration
         for thread in remaining_threads:
             try:
                 # Wait up to 1 second for each thread
-                thread.join(timeout=1.0)
+                thread.wait(1000)
             except Exception as e:
                 print(f"Error waiting for thread: {e}")
         
@@ -2,15 +2,36 @@ from youtube_transcript_api import YouTubeTranscriptApi
 import sys
 import re
 import os
-from openai import OpenAI
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from openai import AsyncOpenAI, RateLimitError
 from dotenv import load_dotenv
 import yt_dlp
+import requests
 import tiktoken
 import json
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import time
 from enum import Enum
+from functools import lru_cache
 import traceback
+import hashlib
+
+try:
+    import blingfire
+except ImportError:
+    blingfire = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # Load environment variables
 load_dotenv()
@@ -19,28 +40,180 @@ load_dotenv()
 OUTPUT_DIR = "Summarator_Output"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+def json_dumps(obj) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Patterns compiled once at import rather than on every call
+VIDEO_ID_PATTERN = re.compile(r'(?:v=|/v/|youtu\.be/|/embed/)([^&?\n]+)')
+URL_PATTERN = re.compile(r'https?://(?:www\.)?(?:youtube\.com|youtu\.be)/.+')
+# Sentence-ending punctuation followed by whitespace; the whitespace is
+# captured rather than matched with a lookbehind so RE2, which has no
+# lookarounds, can run the same pattern in linear time when installed
+SENTENCE_BOUNDARY_PATTERN = (re2 or re).compile(r'[.!?](\s+)')
+
+# Translation table deleting characters that are invalid in filenames
+INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
 class SummaryDepth(Enum):
     BASIC = "basic"
     DETAILED = "detailed"
     TECHNICAL = "technical"
 
+# Prompt templates, built once at import instead of on every request. The
+# instructions go in the system message so every request for a depth shares
+# an identical prefix that OpenAI's prompt caching can reuse.
+CHUNK_SYSTEM_PROMPT = "You are a technical documentation expert who creates detailed, well-structured technical summaries. Focus on technical details, implementation specifics, and actionable information while maintaining clarity and precision."
+
+CHUNK_PROMPTS = {
+    SummaryDepth.BASIC: """Create a concise summary of this video section focusing on the main points and key takeaways.
+
+## Main Points
+- List the key ideas or arguments (3-4 bullet points)
+- Focus on the core message or purpose
+
+## Key Takeaways
+- List practical insights or lessons (2-3 bullet points)
+- Include any actionable advice or recommendations
+""",
+    SummaryDepth.DETAILED: """Create a detailed summary of this video section, capturing both content and context.
+
+## Main Topics
+- List key themes or subjects discussed (2-4 bullet points)
+- Include any relevant background or context
+
+## Content Breakdown
+- Break down the main content points (4-6 bullet points)
+- Include specific examples or demonstrations
+- Note any visual elements or demonstrations
+- Document any step-by-step processes
+
+## Important Details
+- List specific references:
+  * Names, dates, or statistics mentioned
+  * Tools, resources, or materials referenced
+  * External sources or citations
+  * Related topics or concepts
+
+## Notable Points
+- Include significant explanations or insights
+- Document any tips or advice given
+- Note any audience engagement elements
+""",
+    SummaryDepth.TECHNICAL: """Create a comprehensive technical summary of this video section.
+
+## Technical Overview
+- List main technical concepts (2-3 bullet points)
+- Identify key technologies or tools
+- Note system or process architecture
+
+## Technical Details
+- Document specifications:
+  * Technologies and frameworks
+  * Requirements and dependencies
+  * Performance considerations
+  * Security implications
+
+## Implementation Steps
+- Break down technical processes:
+  * Step-by-step instructions
+  * Code examples or configurations
+  * Best practices and guidelines
+  * Common pitfalls to avoid
+
+## Technical Resources
+- List mentioned:
+  * Tools and software
+  * Documentation references
+  * Learning resources
+  * Community resources
+"""
+}
+
+FINAL_SYSTEM_PROMPT = "You are a professional content analyst. Create a cohesive final summary that captures specific details and references while maintaining clarity and actionability. Focus on information that would be most useful to someone wanting to understand or apply the content."
+
+FINAL_SUMMARY_INSTRUCTIONS = """Based on the following collection of key points from different parts of the video, 
+create a cohesive final summary that captures all key elements while maintaining clarity:
+
+## Video Overview
+- Summarize the main purpose and context
+- Identify the target audience
+- Note any prerequisites or background needed
+
+## Key Content
+- Break down the main points (4-6 bullet points)
+- Include specific examples and demonstrations
+- Highlight any step-by-step processes
+- Note any visual elements or demonstrations
+
+## Important Details
+- List specific references:
+  * Names, dates, or statistics
+  * Tools, resources, or materials
+  * External sources or citations
+  * Related topics or concepts
+
+## Notable Quotes
+- Include significant quotes that:
+  * Provide key insights
+  * Explain important concepts
+  * Share personal experiences
+- Always attribute quotes to speakers
+
+## Additional Elements
+- Note any:
+  * Calls to action
+  * Community engagement aspects
+  * Related videos or resources
+  * Timestamps for key moments
+"""
+
+CHUNK_SYSTEM_PROMPTS = {
+    depth: f"{CHUNK_SYSTEM_PROMPT}\n\n{prompt}" for depth, prompt in CHUNK_PROMPTS.items()
+}
+
+FINAL_SUMMARY_SYSTEM_PROMPT = f"{FINAL_SYSTEM_PROMPT}\n\n{FINAL_SUMMARY_INSTRUCTIONS}"
+
 class ProgressTracker:
     """Track and display progress of summary generation."""
+    # Minimum seconds between progress lines, so a burst of chunks finishing
+    # together doesn't flood the terminal
+    PRINT_INTERVAL = 0.2
+    
     def __init__(self, total_chunks: int):
         self.total_chunks = total_chunks
         self.current_chunk = 0
         self.start_time = time.time()
-        self.chunk_times = []
+        # Running total of the time between completions instead of a list,
+        # so the mean costs O(1) per update
+        self.total_chunk_time = 0.0
+        self.last_chunk_end = self.start_time
+        self.last_print = 0.0
     
     def update(self, chunk_index: int, chunk_size: int):
         """Update progress and display status."""
         self.current_chunk = chunk_index + 1
-        chunk_time = time.time() - self.start_time
-        self.chunk_times.append(chunk_time)
+        chunk_end = time.time()
+        self.total_chunk_time += chunk_end - self.last_chunk_end
+        self.last_chunk_end = chunk_end
+        
+        # Always show the final chunk; otherwise throttle the output
+        now = time.monotonic()
+        if self.current_chunk < self.total_chunks and now - self.last_print < self.PRINT_INTERVAL:
+            return
+        self.last_print = now
         
         # Calculate progress
         progress = (self.current_chunk / self.total_chunks) * 100
-        avg_time = sum(self.chunk_times) / len(self.chunk_times)
+        avg_time = self.total_chunk_time / self.current_chunk
         remaining_chunks = self.total_chunks - self.current_chunk
         estimated_time = remaining_chunks * avg_time
         
@@ -52,11 +225,48 @@ class ProgressTracker:
     def complete(self):
         """Display completion message with statistics."""
         total_time = time.time() - self.start_time
-        avg_chunk_time = sum(self.chunk_times) / len(self.chunk_times)
+        avg_chunk_time = self.total_chunk_time / max(self.current_chunk, 1)
         print(f"\n\nSummary generation completed in {total_time:.1f}s")
         print(f"Average time per chunk: {avg_chunk_time:.1f}s")
         print(f"Total chunks processed: {self.total_chunks}")
 
+class RateLimiter:
+    """Token-bucket limiter for OpenAI's requests- and tokens-per-minute budgets."""
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """Add the capacity that has accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.available_requests = min(self.requests_per_minute,
+                                      self.available_requests + elapsed * self.requests_per_minute / 60)
+        self.available_tokens = min(self.tokens_per_minute,
+                                    self.available_tokens + elapsed * self.tokens_per_minute / 60)
+    
+    async def acquire(self, tokens: int):
+        """Wait until one request of the given token cost fits in both budgets."""
+        # A request larger than the whole budget could never fit; let it
+        # through once the bucket is full instead of waiting forever
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_requests >= 1 and self.available_tokens >= tokens:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                # Sleep just long enough for the scarcer budget to refill
+                wait = max((1 - self.available_requests) * 60 / self.requests_per_minute,
+                           (tokens - self.available_tokens) * 60 / self.tokens_per_minute)
+                await asyncio.sleep(max(wait, 0.001))
+
 class Config:
     """Configuration management for the summarizer."""
     def __init__(self):
@@ -65,12 +275,16 @@ class Config:
             "output_dir": "Summarator_Output",
             "max_retries": 4,
             "base_delay": 10,
+            "max_concurrent_requests": 4,
+            "download_concurrency": 8,
+            "requests_per_minute": 500,
+            "tokens_per_minute": 200000,
             "adaptive_delay_min": 5,
             "adaptive_delay_max": 20,
             "chunk_overlap_ratio": 0.1,
             "chunk_size_ratio": 0.4,
             "reserved_tokens": 1000,
-            "default_model": "gpt-3.5-turbo-16k",
+            "default_model": "gpt-4o-mini",
             "default_depth": "detailed",
             "max_tokens_per_chunk": 2000,
             "max_tokens_final": 1500,
@@ -117,25 +331,63 @@ class Cache:
         self.cache_dir = cache_dir
         self.transcript_dir = os.path.join(cache_dir, "transcripts")
         self.summary_dir = os.path.join(cache_dir, "summaries")
-        self.metadata_file = os.path.join(cache_dir, "cache_metadata.json")
+        self.chunk_dir = os.path.join(cache_dir, "chunks")
+        # Metadata is an append-only log of JSON lines, compacted on cleanup
+        self.metadata_file = os.path.join(cache_dir, "cache_metadata.jsonl")
+        self.legacy_metadata_file = os.path.join(cache_dir, "cache_metadata.json")
         os.makedirs(self.transcript_dir, exist_ok=True)
         os.makedirs(self.summary_dir, exist_ok=True)
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        # Transcripts are cached from the URL file's worker threads
+        self._metadata_lock = threading.Lock()
         self.metadata = self.load_metadata()
+        # List the cache directories once so existence checks don't stat
+        self._transcript_files = {entry.name for entry in os.scandir(self.transcript_dir)}
+        self._summary_files = {entry.name for entry in os.scandir(self.summary_dir)}
     
     def load_metadata(self) -> dict:
-        """Load cache metadata."""
-        if os.path.exists(self.metadata_file):
-            try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        """Load cache metadata by replaying the metadata log."""
+        if not os.path.exists(self.metadata_file):
+            # Import metadata from the single JSON file older versions wrote.
+            # The file is left in place: the ytsummarator package still
+            # keeps its own metadata there in the same cache directory
+            if os.path.exists(self.legacy_metadata_file):
+                try:
+                    with open(self.legacy_metadata_file, 'r') as f:
+                        self.metadata = json.load(f)
+                    self.save_metadata()
+                    return self.metadata
+                except Exception:
+                    return {}
+            return {}
+        
+        metadata = {}
+        try:
+            with open(self.metadata_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip a line cut short by an interrupted write
+                    metadata[record.pop("key")] = record
+        except Exception:
+            return {}
+        return metadata
     
     def save_metadata(self):
-        """Save cache metadata."""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=4)
+        """Rewrite the metadata log with one line per current entry."""
+        tmp_file = self.metadata_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            for key, data in self.metadata.items():
+                f.write(json.dumps({"key": key, **data}) + "\n")
+        os.replace(tmp_file, self.metadata_file)
+    
+    def record_metadata(self, key: str, data: dict):
+        """Add or update one metadata entry by appending it to the log."""
+        with self._metadata_lock:
+            self.metadata[key] = data
+            with open(self.metadata_file, 'a') as f:
+                f.write(json.dumps({"key": key, **data}) + "\n")
     
     def get_transcript_path(self, video_id: str) -> str:
         """Get the path for a cached transcript."""
@@ -145,64 +397,101 @@ class Cache:
         """Get the path for a cached summary."""
         return os.path.join(self.summary_dir, f"{video_id}_{depth}_{model}.md")
     
+    def get_chunk_key(self, chunk: str, depth: str, model: str) -> str:
+        """Get the content-addressed key for a chunk summary."""
+        return hashlib.sha256(f"{model}|{depth}|{chunk}".encode('utf-8')).hexdigest()
+    
+    def get_chunk_summary_path(self, key: str) -> str:
+        """Get the path for a cached chunk summary."""
+        return os.path.join(self.chunk_dir, f"{key}.md")
+    
     def has_transcript(self, video_id: str) -> bool:
         """Check if transcript is cached."""
-        return os.path.exists(self.get_transcript_path(video_id))
+        return f"{video_id}.json" in self._transcript_files
     
     def has_summary(self, video_id: str, depth: str, model: str) -> bool:
         """Check if summary is cached."""
-        return os.path.exists(self.get_summary_path(video_id, depth, model))
+        return f"{video_id}_{depth}_{model}.md" in self._summary_files
     
     def get_transcript(self, video_id: str) -> List[Dict]:
         """Get cached transcript."""
         if self.has_transcript(video_id):
-            with open(self.get_transcript_path(video_id), 'r') as f:
-                return json.load(f)
+            try:
+                with open(self.get_transcript_path(video_id), 'rb') as f:
+                    return json_loads(f.read())
+            except FileNotFoundError:
+                self._transcript_files.discard(f"{video_id}.json")
         return None
     
     def get_summary(self, video_id: str, depth: str, model: str) -> str:
         """Get cached summary."""
         if self.has_summary(video_id, depth, model):
-            with open(self.get_summary_path(video_id, depth, model), 'r') as f:
-                return f.read()
+            try:
+                with open(self.get_summary_path(video_id, depth, model), 'r') as f:
+                    return f.read()
+            except FileNotFoundError:
+                self._summary_files.discard(f"{video_id}_{depth}_{model}.md")
         return None
     
+    def get_chunk_summary(self, key: str) -> str:
+        """Get cached chunk summary."""
+        try:
+            with open(self.get_chunk_summary_path(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
     def cache_transcript(self, video_id: str, transcript: List[Dict]):
         """Cache transcript."""
-        with open(self.get_transcript_path(video_id), 'w') as f:
-            json.dump(transcript, f)
-        self.metadata[f"transcript_{video_id}"] = {
+        data = json_dumps(transcript)
+        with open(self.get_transcript_path(video_id), 'wb') as f:
+            f.write(data)
+        self._transcript_files.add(f"{video_id}.json")
+        self.record_metadata(f"transcript_{video_id}", {
             "timestamp": time.time(),
-            "size": len(str(transcript))
-        }
-        self.save_metadata()
+            "size": len(data)
+        })
     
     def cache_summary(self, video_id: str, depth: str, model: str, summary: str):
         """Cache summary."""
         with open(self.get_summary_path(video_id, depth, model), 'w') as f:
             f.write(summary)
-        self.metadata[f"summary_{video_id}_{depth}_{model}"] = {
+        self._summary_files.add(f"{video_id}_{depth}_{model}.md")
+        self.record_metadata(f"summary_{video_id}_{depth}_{model}", {
             "timestamp": time.time(),
             "size": len(summary)
-        }
-        self.save_metadata()
+        })
+    
+    def cache_chunk_summary(self, key: str, summary: str):
+        """Cache chunk summary."""
+        with open(self.get_chunk_summary_path(key), 'w', encoding='utf-8') as f:
+            f.write(summary)
+        self.record_metadata(f"chunk_{key}", {
+            "timestamp": time.time(),
+            "size": len(summary)
+        })
     
     def cleanup(self, max_age_days: int = 30):
-        """Clean up old cache entries."""
+        """Clean up old cache entries and compact the metadata log."""
         current_time = time.time()
         max_age = max_age_days * 24 * 60 * 60  # Convert days to seconds
         
-        for key, data in list(self.metadata.items()):
-            if current_time - data["timestamp"] > max_age:
-                if key.startswith("transcript_"):
-                    video_id = key.split("_")[1]
-                    os.remove(self.get_transcript_path(video_id))
-                elif key.startswith("summary_"):
-                    _, video_id, depth, model = key.split("_")
-                    os.remove(self.get_summary_path(video_id, depth, model))
-                del self.metadata[key]
-        
-        self.save_metadata()
+        with self._metadata_lock:
+            for key, data in list(self.metadata.items()):
+                if current_time - data["timestamp"] > max_age:
+                    if key.startswith("transcript_"):
+                        video_id = key.split("_")[1]
+                        os.remove(self.get_transcript_path(video_id))
+                        self._transcript_files.discard(f"{video_id}.json")
+                    elif key.startswith("summary_"):
+                        _, video_id, depth, model = key.split("_")
+                        os.remove(self.get_summary_path(video_id, depth, model))
+                        self._summary_files.discard(f"{video_id}_{depth}_{model}.md")
+                    elif key.startswith("chunk_"):
+                        os.remove(self.get_chunk_summary_path(key[len("chunk_"):]))
+                    del self.metadata[key]
+            
+            self.save_metadata()
 
 # Initialize global configuration
 config = Config()
@@ -210,15 +499,28 @@ config = Config()
 # Initialize global cache
 cache = Cache()
 
-def num_tokens_from_string(string: str, model: str = "gpt-4") -> int:
+# Model used when callers don't pick one; OPENAI_MODEL overrides the config
+DEFAULT_MODEL = os.getenv('OPENAI_MODEL') or config.get("default_model", "gpt-4o-mini")
+
+@lru_cache(maxsize=4)
+def get_encoding(model: str = None) -> tiktoken.Encoding:
+    """Get the tokenizer for a model, created once per model on first use."""
+    try:
+        return tiktoken.encoding_for_model(model or DEFAULT_MODEL)
+    except KeyError:
+        # Unknown model names get the encoding of the current GPT-4o models
+        return tiktoken.get_encoding("o200k_base")
+
+def num_tokens_from_string(string: str, model: str = None) -> int:
     """Returns the number of tokens in a text string."""
-    encoding = tiktoken.encoding_for_model(model)
-    num_tokens = len(encoding.encode(string))
+    num_tokens = len(get_encoding(model).encode(string))
     return num_tokens
 
 def get_model_context_window(model: str) -> int:
     """Get the context window size for a specific model."""
     context_windows = {
+        "gpt-4o": 128000,
+        "gpt-4o-mini": 128000,
         "gpt-4-turbo": 128000,
         "gpt-4": 8192,
         "gpt-4-32k": 32768,
@@ -247,30 +549,64 @@ def get_chunk_parameters(model: str) -> tuple[int, int]:
     
     return max_chunk_tokens, overlap_tokens
 
-def chunk_transcript(text: str, model: str = "gpt-4", max_tokens: int = None, overlap_tokens: int = None) -> List[Dict[str, str]]:
-    """Split transcript into chunks using tiktoken's tokenizer with improved semantic chunking."""
-    encoding = tiktoken.encoding_for_model(model)
+def iter_sentences(text: str) -> Iterator[str]:
+    """Yield the sentences of text, using blingfire's segmenter when installed."""
+    if blingfire is not None:
+        # blingfire's compiled segmenter handles abbreviations like "Dr."
+        # that the boundary regex splits on, and returns one sentence per line
+        yield from blingfire.text_to_sentences(text).split('\n')
+        return
     
+    # Walk the boundaries instead of splitting, so the whole sentence list
+    # never has to exist at once
+    start = 0
+    for match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        yield text[start:match.start(1)]
+        start = match.end()
+    yield text[start:]
+
+def chunk_transcript(text: str, model: str = None, max_tokens: int = None, overlap_tokens: int = None,
+                     precise: bool = False) -> List[Dict[str, str]]:
+    """Split transcript into sentence-aligned chunks of roughly max_tokens tokens.
+    
+    For ASCII text, sentence sizes are estimated at four characters per token,
+    which is close for English. Other scripts (CJK in particular) can take a
+    token per character or more, so their sentences are counted with the
+    tokenizer. Pass precise=True to have each chunk's token_count recounted
+    with the tokenizer afterwards.
+    """
     # Get appropriate chunk parameters if not provided
     if max_tokens is None or overlap_tokens is None:
-        max_tokens, overlap_tokens = get_chunk_parameters(model)
-    
-    # First split into sentences for better semantic chunking
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+        max_tokens, overlap_tokens = get_chunk_parameters(model or DEFAULT_MODEL)
     
     chunks = []
+    # (sentence, token count) pairs, so overlap sizing reuses the counts
     current_chunk = []
     current_tokens = 0
     
-    for sentence in sentences:
-        # Get token count for this sentence
-        sentence_tokens = encoding.encode(sentence)
-        sentence_token_count = len(sentence_tokens)
-        
+    # Work through the transcript sentence by sentence for better semantic
+    # chunking. Caption noise leaves empty or whitespace-only pieces; they
+    # would only add stray spaces to the joined chunk
+    sentences = (sentence for sentence in iter_sentences(text)
+                 if sentence and not sentence.isspace())
+    
+    if text.isascii():
+        # Chunk boundaries only need approximate sizes, so keep the tokenizer
+        # out of the common case and let the sentences stream through
+        sized_sentences = ((sentence, max(1, len(sentence) // 4)) for sentence in sentences)
+    else:
+        # The four-characters estimate undercounts non-Latin text by up to
+        # 4x, enough to overflow the context window, so count exactly; the
+        # batched encoder needs the sentences as a list
+        sentences = list(sentences)
+        token_lists = get_encoding(model).encode_ordinary_batch(sentences, num_threads=os.cpu_count() or 1)
+        sized_sentences = ((sentence, max(1, len(tokens))) for sentence, tokens in zip(sentences, token_lists))
+    
+    for sentence, sentence_token_count in sized_sentences:
         # If adding this sentence would exceed the limit, save current chunk
         if current_tokens + sentence_token_count > max_tokens and current_chunk:
             # Join the current chunk
-            chunk_text = ' '.join(current_chunk)
+            chunk_text = ' '.join(part for part, _ in current_chunk)
             chunks.append({
                 'text': chunk_text,
                 'token_count': current_tokens
@@ -278,43 +614,64 @@ def chunk_transcript(text: str, model: str = "gpt-4", max_tokens: int = None, ov
             
             # Start new chunk with overlap
             # Find sentences that fit within overlap_tokens
-            overlap_text = ''
+            overlap = []
             overlap_tokens_count = 0
-            for prev_sentence in reversed(current_chunk):
-                prev_tokens = len(encoding.encode(prev_sentence))
+            for prev_sentence, prev_tokens in reversed(current_chunk):
                 if overlap_tokens_count + prev_tokens <= overlap_tokens:
-                    overlap_text = prev_sentence + ' ' + overlap_text
+                    overlap.append((prev_sentence, prev_tokens))
                     overlap_tokens_count += prev_tokens
                 else:
                     break
             
-            current_chunk = overlap_text.strip().split()
+            current_chunk = overlap[::-1]
             current_tokens = overlap_tokens_count
         
-        current_chunk.append(sentence)
+        current_chunk.append((sentence, sentence_token_count))
         current_tokens += sentence_token_count
     
     # Add the last chunk if it exists
     if current_chunk:
-        chunk_text = ' '.join(current_chunk)
+        chunk_text = ' '.join(part for part, _ in current_chunk)
         chunks.append({
             'text': chunk_text,
             'token_count': current_tokens
         })
     
+    if precise and chunks:
+        # Recount the emitted chunks in one batched, multi-threaded call
+        encoding = get_encoding(model)
+        token_lists = encoding.encode_ordinary_batch([chunk['text'] for chunk in chunks],
+                                                     num_threads=os.cpu_count() or 1)
+        for chunk, tokens in zip(chunks, token_lists):
+            chunk['token_count'] = len(tokens)
+    
     return chunks
 
 def sanitize_filename(title):
     """Convert title to a valid filename."""
     # Remove invalid filename characters
-    invalid_chars = r'<>:"/\\|?*'
-    for char in invalid_chars:
-        title = title.replace(char, '')
+    title = title.translate(INVALID_FILENAME_CHARS)
     # Limit length and strip whitespace
     return title.strip()[:100]
 
+# Shared HTTP session so title lookups reuse pooled connections
+_session = requests.Session()
+
 def get_video_title(video_id):
     """Get the title of a YouTube video."""
+    # The oEmbed endpoint returns the title in a small JSON response, far
+    # cheaper than a full yt-dlp extraction; fall back to yt-dlp if it fails
+    try:
+        response = _session.get(
+            "https://www.youtube.com/oembed",
+            params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+            timeout=5,
+        )
+        response.raise_for_status()
+        return sanitize_filename(response.json().get('title', video_id))
+    except Exception:
+        pass
+    
     ydl_opts = {
         'quiet': True,
         'no_warnings': True,
@@ -326,23 +683,37 @@ def get_video_title(video_id):
             info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
             return sanitize_filename(info.get('title', video_id))
     except Exception as e:
-        print(f"Warning: Could not fetch video title: {str(e)}")
+        log(f"Warning: Could not fetch video title: {str(e)}")
         return video_id
 
 def extract_video_id(url):
     """Extract the video ID from a YouTube URL."""
-    patterns = [
-        r'(?:v=|/v/|youtu\.be/|/embed/)([^&?\n]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = VIDEO_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+# Held while picking a versioned filename and creating the file, so
+# concurrent saves can't claim the same name
+_filename_lock = threading.Lock()
+
+# Progress lines from URL-file worker threads are printed whole under this
+# lock and tagged with their task, so lines from different videos can be
+# told apart
+_print_lock = threading.Lock()
+_log_context = threading.local()
+
+def log(message: str):
+    """Print a progress line, prefixed with the current task's tag if any."""
+    prefix = getattr(_log_context, "prefix", "")
+    with _print_lock:
+        print(f"{prefix}{message}")
 
 def get_next_available_filename(base_filename: str, extension: str, output_dir: str = None) -> str:
-    """Get the next available filename by adding a version number if the file exists."""
+    """Get the next available filename by adding a version number if the file exists.
+    
+    base_filename is either a bare name, placed in output_dir (or
+    OUTPUT_DIR), or a path of its own, as the GUI transcript worker
+    passes; an absolute path ignores output_dir.
+    """
     # Use provided output directory or default
     target_dir = output_dir if output_dir else OUTPUT_DIR
     
@@ -352,104 +723,42 @@ def get_next_available_filename(base_filename: str, extension: str, output_dir:
     if not os.path.exists(f"{base_filepath}{extension}"):
         return f"{base_filepath}{extension}"
     
-    counter = 1
-    while os.path.exists(f"{base_filepath} ({counter}){extension}"):
-        counter += 1
+    # List the directory once and continue after the highest existing
+    # version rather than stat'ing one candidate at a time. base_filename
+    # may itself be a path, so scan the directory the file actually lands
+    # in and match on its final component
+    file_dir, file_name = os.path.split(base_filepath)
+    pattern = re.compile(re.escape(file_name) + r' \((\d+)\)' + re.escape(extension) + r'$')
+    with os.scandir(file_dir or ".") as entries:
+        versions = [int(m.group(1)) for entry in entries if (m := pattern.match(entry.name))]
+    counter = max(versions) + 1 if versions else 1
     
     return f"{base_filepath} ({counter}){extension}"
 
-def generate_chunk_summary(chunk: str, chunk_index: int, total_chunks: int, client: OpenAI, depth: SummaryDepth = SummaryDepth.DETAILED, model: str = None) -> str:
+async def generate_chunk_summary(chunk: str, chunk_index: int, total_chunks: int, client: AsyncOpenAI, depth: SummaryDepth = SummaryDepth.DETAILED, model: str = None) -> str:
     """Generate a summary for a single chunk of the transcript with configurable depth."""
     try:
         # Use configured model if none provided
-        model = model or config.get("default_model", "gpt-4")
+        model = model or DEFAULT_MODEL
         
         # Get configuration values
         max_tokens = config.get("max_tokens_per_chunk", 2000)
         temperature = config.get("temperature", 0.5)
         timeout = config.get("timeout", 60)
         
-        # Base prompt structure
-        base_prompt = {
-            SummaryDepth.BASIC: """Create a concise summary of this video section focusing on the main points and key takeaways.
-
-## Main Points
-- List the key ideas or arguments (3-4 bullet points)
-- Focus on the core message or purpose
-
-## Key Takeaways
-- List practical insights or lessons (2-3 bullet points)
-- Include any actionable advice or recommendations
-""",
-            SummaryDepth.DETAILED: """Create a detailed summary of this video section, capturing both content and context.
-
-## Main Topics
-- List key themes or subjects discussed (2-4 bullet points)
-- Include any relevant background or context
-
-## Content Breakdown
-- Break down the main content points (4-6 bullet points)
-- Include specific examples or demonstrations
-- Note any visual elements or demonstrations
-- Document any step-by-step processes
-
-## Important Details
-- List specific references:
-  * Names, dates, or statistics mentioned
-  * Tools, resources, or materials referenced
-  * External sources or citations
-  * Related topics or concepts
-
-## Notable Points
-- Include significant explanations or insights
-- Document any tips or advice given
-- Note any audience engagement elements
-""",
-            SummaryDepth.TECHNICAL: """Create a comprehensive technical summary of this video section.
-
-## Technical Overview
-- List main technical concepts (2-3 bullet points)
-- Identify key technologies or tools
-- Note system or process architecture
-
-## Technical Details
-- Document specifications:
-  * Technologies and frameworks
-  * Requirements and dependencies
-  * Performance considerations
-  * Security implications
-
-## Implementation Steps
-- Break down technical processes:
-  * Step-by-step instructions
-  * Code examples or configurations
-  * Best practices and guidelines
-  * Common pitfalls to avoid
-
-## Technical Resources
-- List mentioned:
-  * Tools and software
-  * Documentation references
-  * Learning resources
-  * Community resources
-"""
-        }
-
-        # Select prompt based on depth
-        selected_prompt = base_prompt[depth]
+        # The instructions live in the system prompt; only the chunk and
+        # its position go in the user message
+        prompt = f"Transcript portion:\n{chunk}"
         
         # Add context for multi-chunk summaries
         if total_chunks > 1:
             context = "beginning of" if chunk_index == 0 else "middle of" if chunk_index < total_chunks - 1 else "end of"
-            selected_prompt = f"This is part {chunk_index + 1} of {total_chunks} (the {context} the video).\n\n{selected_prompt}"
-
-        # Complete prompt
-        prompt = f"{selected_prompt}\n\nTranscript portion:\n{chunk}"
+            prompt = f"This is part {chunk_index + 1} of {total_chunks} (the {context} the video).\n\n{prompt}"
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": "You are a technical documentation expert who creates detailed, well-structured technical summaries. Focus on technical details, implementation specifics, and actionable information while maintaining clarity and precision."},
+                {"role": "system", "content": CHUNK_SYSTEM_PROMPTS[depth]},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=max_tokens,
@@ -458,57 +767,25 @@ def generate_chunk_summary(chunk: str, chunk_index: int, total_chunks: int, clie
         )
         
         return response.choices[0].message.content
+    except RateLimitError:
+        # Let the caller back off and retry
+        raise
     except Exception as e:
         print(f"Error generating chunk summary: {str(e)}")
         return ""
 
-def generate_final_summary(intermediate_summaries: List[str], client: OpenAI, depth: SummaryDepth, model: str = "gpt-4") -> str:
+async def generate_final_summary(intermediate_summaries: List[str], client: AsyncOpenAI, depth: SummaryDepth, model: str = None) -> str:
     """Generate a final summary from all intermediate summaries."""
     try:
+        model = model or DEFAULT_MODEL
         combined_points = "\n\n".join(intermediate_summaries)
         
-        prompt = f"""Based on the following collection of key points from different parts of the video, 
-create a cohesive final summary that captures all key elements while maintaining clarity:
-
-## Video Overview
-- Summarize the main purpose and context
-- Identify the target audience
-- Note any prerequisites or background needed
-
-## Key Content
-- Break down the main points (4-6 bullet points)
-- Include specific examples and demonstrations
-- Highlight any step-by-step processes
-- Note any visual elements or demonstrations
-
-## Important Details
-- List specific references:
-  * Names, dates, or statistics
-  * Tools, resources, or materials
-  * External sources or citations
-  * Related topics or concepts
-
-## Notable Quotes
-- Include significant quotes that:
-  * Provide key insights
-  * Explain important concepts
-  * Share personal experiences
-- Always attribute quotes to speakers
-
-## Additional Elements
-- Note any:
-  * Calls to action
-  * Community engagement aspects
-  * Related videos or resources
-  * Timestamps for key moments
+        prompt = f"Key points from transcript:\n{combined_points}"
 
-Key points from transcript:
-{combined_points}"""
-
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": "You are a professional content analyst. Create a cohesive final summary that captures specific details and references while maintaining clarity and actionability. Focus on information that would be most useful to someone wanting to understand or apply the content."},
+                {"role": "system", "content": FINAL_SUMMARY_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=config.get("max_tokens_final", 1500),
@@ -517,22 +794,77 @@ Key points from transcript:
         )
         
         return response.choices[0].message.content
+    except RateLimitError:
+        # Let the caller back off and retry
+        raise
     except Exception as e:
         print(f"Error generating final summary: {str(e)}")
         return None
 
-def generate_summary(text: str, depth: SummaryDepth = SummaryDepth.DETAILED, model: str = "gpt-3.5-turbo-16k") -> str:
-    """Generate a structured Markdown summary using OpenAI's GPT models with configurable depth."""
+def get_retry_after(error: RateLimitError) -> float:
+    """Get the wait the API asked for in a rate limit response, if it sent one."""
+    headers = getattr(error.response, 'headers', None) or {}
     try:
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        if not client.api_key:
-            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your environment variables.")
+        if 'retry-after-ms' in headers:
+            return float(headers['retry-after-ms']) / 1000
+        if 'retry-after' in headers:
+            return float(headers['retry-after'])
+    except ValueError:
+        pass
+    return None
+
+async def summarize_chunk_with_retry(chunk: Dict, chunk_index: int, total_chunks: int, client: AsyncOpenAI,
+                                     depth: SummaryDepth, model: str, semaphore: asyncio.Semaphore,
+                                     limiter: RateLimiter) -> str:
+    """Summarize one chunk, retrying with backoff while holding a request slot."""
+    max_retries = config.get("max_retries", 4)
+    base_delay = config.get("base_delay", 10)
+    # Budget the prompt plus the largest response the request may return
+    request_tokens = chunk['token_count'] + config.get("max_tokens_per_chunk", 2000)
+    
+    # Identical chunk text summarized with the same depth and model is reused
+    # from earlier runs instead of calling the API again. Cache file I/O runs
+    # in a worker thread so it never stalls the other in-flight requests.
+    cache_key = cache.get_chunk_key(chunk['text'], depth.value, model)
+    cached_summary = await asyncio.to_thread(cache.get_chunk_summary, cache_key)
+    if cached_summary:
+        return cached_summary
+    
+    async with semaphore:
+        for retry in range(max_retries):
+            try:
+                if retry > 0:
+                    delay = base_delay * (1.5 ** (retry - 1))
+                    print(f"\nRetry {retry}/{max_retries} for chunk {chunk_index + 1} after {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                
+                await limiter.acquire(request_tokens)
+                summary = await generate_chunk_summary(chunk['text'], chunk_index, total_chunks, client, depth, model)
+                if summary:
+                    await asyncio.to_thread(cache.cache_chunk_summary, cache_key, summary)
+                    return summary
+            except RateLimitError as e:
+                if retry == max_retries - 1:
+                    print(f"\nRate limit exceeded after {max_retries} retries")
+                    raise
+                # Wait as long as the API asked, or increase the delay
+                retry_after = get_retry_after(e)
+                await asyncio.sleep(retry_after if retry_after is not None else base_delay * (2 ** retry))
+    return ""
+
+async def generate_summary_async(text: str, depth: SummaryDepth, model: str) -> str:
+    """Summarize all chunks concurrently, then combine them into a final summary."""
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your environment variables.")
 
-        # Add exponential backoff for rate limiting with adaptive delays
+    async with AsyncOpenAI(api_key=api_key) as client:
         max_retries = config.get("max_retries", 4)
         base_delay = config.get("base_delay", 10)  # Increased base delay for rate limits
-        total_tokens = num_tokens_from_string(text)
-        print(f"Total transcript tokens: {total_tokens}")
+        # Only shown to the user, so estimate rather than encode the whole
+        # transcript a second time
+        approx_tokens = len(text) // 4
+        print(f"Approx transcript tokens: {approx_tokens}")
         
         # Get appropriate chunk parameters for the model
         max_chunk_tokens, overlap_tokens = get_chunk_parameters(model)
@@ -545,39 +877,25 @@ def generate_summary(text: str, depth: SummaryDepth = SummaryDepth.DETAILED, mod
         
         # Initialize progress tracker
         progress = ProgressTracker(total_chunks)
+        completed = 0
         
-        intermediate_summaries = []
-        for i, chunk in enumerate(chunks):
-            # Update progress
-            progress.update(i, chunk['token_count'])
-            
-            # Calculate adaptive delay based on token count
-            adaptive_delay = max(5, min(20, chunk['token_count'] / 500))  # 5-20 seconds based on chunk size
-            
-            for retry in range(max_retries):
-                try:
-                    if retry > 0:
-                        delay = base_delay * (1.5 ** (retry - 1))
-                        print(f"\nRetry {retry}/{max_retries} after {delay:.1f} seconds...")
-                        time.sleep(delay)
-                    
-                    summary = generate_chunk_summary(chunk['text'], i, total_chunks, client, depth, model)
-                    if summary:
-                        intermediate_summaries.append(summary)
-                        # Add adaptive delay between chunks
-                        if i < total_chunks - 1:
-                            time.sleep(adaptive_delay)
-                        break
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "rate limit" in error_msg or "too many requests" in error_msg:
-                        if retry == max_retries - 1:
-                            print(f"\nRate limit exceeded after {max_retries} retries")
-                            raise
-                        # Increase delay for rate limit errors
-                        time.sleep(base_delay * (2 ** retry))
-                        continue
-                    raise
+        # Chunks are independent, so request them all at once; the semaphore
+        # caps how many are in flight and the limiter paces them to the
+        # account's rate limits
+        semaphore = asyncio.Semaphore(config.get("max_concurrent_requests", 4))
+        limiter = RateLimiter(config.get("requests_per_minute", 500),
+                              config.get("tokens_per_minute", 200000))
+        
+        async def summarize(i: int, chunk: Dict) -> str:
+            nonlocal completed
+            summary = await summarize_chunk_with_retry(chunk, i, total_chunks, client, depth, model, semaphore, limiter)
+            progress.update(completed, chunk['token_count'])
+            completed += 1
+            return summary
+        
+        # gather keeps the results in chunk order regardless of completion order
+        summaries = await asyncio.gather(*(summarize(i, chunk) for i, chunk in enumerate(chunks)))
+        intermediate_summaries = [summary for summary in summaries if summary]
         
         if not intermediate_summaries:
             print("\nNo summaries were generated from any chunks")
@@ -590,20 +908,25 @@ def generate_summary(text: str, depth: SummaryDepth = SummaryDepth.DETAILED, mod
                 if retry > 0:
                     delay = base_delay * 2 * (1.5 ** (retry - 1))  # Double base delay for final summary
                     print(f"Retrying final summary after {delay:.1f} seconds...")
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 
-                final_summary = generate_final_summary(intermediate_summaries, client, depth, model)
+                await limiter.acquire(sum(len(summary) for summary in intermediate_summaries) // 4
+                                      + config.get("max_tokens_final", 1500))
+                final_summary = await generate_final_summary(intermediate_summaries, client, depth, model)
                 progress.complete()
                 return final_summary
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "rate limit" in error_msg or "too many requests" in error_msg:
-                    if retry == max_retries - 1:
-                        print(f"\nRate limit exceeded during final summary after {max_retries} retries")
-                        raise
-                    continue
-                raise
-                
+            except RateLimitError as e:
+                if retry == max_retries - 1:
+                    print(f"\nRate limit exceeded during final summary after {max_retries} retries")
+                    raise
+                retry_after = get_retry_after(e)
+                if retry_after is not None:
+                    await asyncio.sleep(retry_after)
+
+def generate_summary(text: str, depth: SummaryDepth = SummaryDepth.DETAILED, model: str = None) -> str:
+    """Generate a structured Markdown summary using OpenAI's GPT models with configurable depth."""
+    try:
+        return asyncio.run(generate_summary_async(text, depth, model or DEFAULT_MODEL))
     except KeyboardInterrupt:
         print("\nSummary generation cancelled by user.")
         return None
@@ -614,9 +937,10 @@ def generate_summary(text: str, depth: SummaryDepth = SummaryDepth.DETAILED, mod
 def get_transcript_with_retry(video_id: str, max_retries: int = 3, base_delay: int = 5) -> List[Dict]:
     """Get transcript with retry mechanism and caching."""
     # Check cache first
-    if cache.has_transcript(video_id):
-        print("Using cached transcript...")
-        return cache.get_transcript(video_id)
+    transcript = cache.get_transcript(video_id)
+    if transcript is not None:
+        log("Using cached transcript...")
+        return transcript
     
     # If not in cache, fetch with retry
     for attempt in range(max_retries):
@@ -629,7 +953,7 @@ def get_transcript_with_retry(video_id: str, max_retries: int = 3, base_delay: i
             if attempt == max_retries - 1:
                 raise
             delay = base_delay * (2 ** attempt)
-            print(f"Attempt {attempt + 1}/{max_retries} failed. Retrying in {delay} seconds...")
+            log(f"Attempt {attempt + 1}/{max_retries} failed. Retrying in {delay} seconds...")
             time.sleep(delay)
 
 def get_summary(video_url, output_dir: str = None):
@@ -650,19 +974,22 @@ def get_summary(video_url, output_dir: str = None):
         transcript = get_transcript_with_retry(video_id)
         
         # Combine transcript text
-        full_transcript = "\n".join([entry['text'] for entry in transcript])
+        full_transcript = "\n".join(entry['text'] for entry in transcript)
+        # The per-entry dicts aren't needed past this point; release them
+        # before the long summarization phase
+        del transcript
         
         # Check if summary is cached
         depth = os.getenv('SUMMARY_DEPTH', 'detailed')
-        model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo-16k')
+        model = DEFAULT_MODEL
         
-        if cache.has_summary(video_id, depth, model):
+        summary = cache.get_summary(video_id, depth, model)
+        if summary is not None:
             print("Using cached summary...")
-            summary = cache.get_summary(video_id, depth, model)
         else:
             # Generate new summary
             print("\nGenerating summary...")
-            summary = generate_summary(full_transcript)
+            summary = generate_summary(full_transcript, model=model)
             if summary:
                 # Cache the summary
                 cache.cache_summary(video_id, depth, model, summary)
@@ -679,13 +1006,17 @@ def get_summary(video_url, output_dir: str = None):
 - Summary Depth: {depth}
 
 """
-            summary_with_metadata = f"{metadata}\n{summary}"
             
             # Save summary with versioning
             base_summary_file = f"{video_title} - summary"
-            summary_file = get_next_available_filename(base_summary_file, ".md", output_dir)
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(summary_with_metadata)
+            with _filename_lock:
+                summary_file = get_next_available_filename(base_summary_file, ".md", output_dir)
+                with open(summary_file, 'w', encoding='utf-8') as f:
+                    # Write the header and body separately rather than
+                    # concatenating them into one more copy of the summary
+                    f.write(metadata)
+                    f.write("\n")
+                    f.write(summary)
             print(f"Summary has been saved to {summary_file}")
             return summary_file
         
@@ -718,57 +1049,73 @@ def get_transcript(video_url, output_dir: str = None):
 
         video_id = extract_video_id(video_url)
         if not video_id:
-            print("Error: Could not extract video ID from URL")
-            return
+            log("Error: Could not extract video ID from URL")
+            return None, None
 
         # Get video title
-        print("Fetching video title...")
+        log("Fetching video title...")
         video_title = get_video_title(video_id)
-        print(f"Parsing {video_title}")
+        log(f"Parsing {video_title}")
         
-        # Get the transcript
-        print("Downloading transcript...")
-        transcript = YouTubeTranscriptApi.get_transcript(video_id)
+        # Get the transcript, reusing the cached copy from an earlier run
+        log("Downloading transcript...")
+        transcript = get_transcript_with_retry(video_id)
         
         # Combine transcript text
-        full_transcript = "\n".join([entry['text'] for entry in transcript])
+        full_transcript = "\n".join(entry['text'] for entry in transcript)
+        del transcript
         
         # Save transcript with versioning
         base_transcript_file = f"{video_title} - transcript"
-        transcript_file = get_next_available_filename(base_transcript_file, ".txt", target_dir)
-        with open(transcript_file, 'w', encoding='utf-8') as f:
-            f.write(full_transcript)
-        print(f"Transcript has been saved to {transcript_file}")
+        with _filename_lock:
+            transcript_file = get_next_available_filename(base_transcript_file, ".txt", target_dir)
+            with open(transcript_file, 'w', encoding='utf-8') as f:
+                f.write(full_transcript)
+        log(f"Transcript has been saved to {transcript_file}")
         return transcript_file, full_transcript
         
     except KeyboardInterrupt:
-        print("\nOperation cancelled by user.")
+        log("Operation cancelled by user.")
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        log(f"An error occurred: {str(e)}")
     return None, None
 
 def is_url(text: str) -> bool:
     """Check if the input is a URL."""
-    url_pattern = r'https?://(?:www\.)?(?:youtube\.com|youtu\.be)/.+'
-    return bool(re.match(url_pattern, text))
+    return URL_PATTERN.match(text) is not None
 
 def process_url_file(file_path: str):
     """Process a file containing YouTube URLs, one per line."""
     try:
         with open(file_path, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and is_url(line.strip())]
+            # Drop duplicate URLs, keeping the order they appear in
+            urls = list(dict.fromkeys(line.strip() for line in f if line.strip() and is_url(line.strip())))
         
         if not urls:
             print(f"No valid YouTube URLs found in {file_path}")
             return
         
         print(f"Found {len(urls)} URLs to process")
-        for i, url in enumerate(urls, 1):
-            print(f"\nProcessing URL {i}/{len(urls)}")
-            print(f"URL: {url}")
-            print("-" * 50)
-            get_transcript(url)
-            print("-" * 50)
+        
+        def fetch(index: int, url: str):
+            # Tag this task's progress lines with its position in the file
+            _log_context.prefix = f"[{index}/{len(urls)}] "
+            try:
+                return get_transcript(url)
+            finally:
+                _log_context.prefix = ""
+        
+        # Every step is network-bound, so fetch several videos at once
+        with ThreadPoolExecutor(max_workers=min(config.get("download_concurrency", 8), len(urls))) as executor:
+            futures = {executor.submit(fetch, index, url): (index, url)
+                       for index, url in enumerate(urls, 1)}
+            for future in as_completed(futures):
+                # Drop each finished future so its transcript text can be
+                # freed instead of being held until the whole batch is done
+                index, url = futures.pop(future)
+                transcript_file, _ = future.result()
+                status = "Done" if transcript_file else "Failed"
+                log(f"{'-' * 50}\n[{index}/{len(urls)}] {status}: {url}\n{'-' * 50}")
     
     except Exception as e:
         print(f"Error processing URL file: {str(e)}")
@@ -1,16 +1,15 @@
 """Main entry point for the YouTube Summarator package."""
 import argparse
+import os
 from .core.summarizer import YouTubeSummarizer
 from .models.summary_depth import SummaryDepth
 from .config.settings import Config
-from .gui.main_window import YouTubeDownloaderGUI
-from PyQt6.QtWidgets import QApplication
 import sys
 
 def cli_main():
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(description="Summarize YouTube videos")
-    parser.add_argument("url", help="YouTube video URL")
+    parser.add_argument("url", help="YouTube video URL, or a file with one URL per line")
     parser.add_argument(
         "--depth",
         choices=[d.value for d in SummaryDepth],
@@ -26,28 +25,58 @@ def cli_main():
         "--config",
         help="Path to configuration file"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Maximum number of chunk requests in flight at once"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit chunks through the OpenAI Batch API (slower, half the cost)"
+    )
     
     args = parser.parse_args()
     
     # Load configuration
     config = Config(args.config) if args.config else Config()
+    if args.concurrency:
+        config.config["max_concurrent_requests"] = args.concurrency
+    if args.batch:
+        config.config["use_batch_api"] = True
     
     # Create summarizer
     summarizer = YouTubeSummarizer(config)
     
+    depth = SummaryDepth.from_str(args.depth)
+    
+    if os.path.isfile(args.url):
+        # Summarize every video in the file at once, sharing rate limits
+        with open(args.url, "r") as f:
+            urls = list(dict.fromkeys(line.strip() for line in f if line.strip()))
+        summaries = summarizer.summarize_videos(urls, depth, args.model)
+        for url, summary in zip(urls, summaries):
+            if summary:
+                summarizer.save_summary(summary, summarizer.get_video_id(url), depth, args.model)
+        return
+    
     # Generate summary
     summary = summarizer.summarize_video(
         args.url,
-        SummaryDepth(args.depth),
+        depth,
         args.model
     )
     
     # Save summary
     video_id = summarizer.get_video_id(args.url)
-    summarizer.save_summary(summary, video_id, SummaryDepth(args.depth), args.model)
+    summarizer.save_summary(summary, video_id, depth, args.model)
 
 def gui_main():
     """Main entry point for the GUI."""
+    # Qt is only needed here, so CLI runs don't pay for loading it
+    from PyQt6.QtWidgets import QApplication
+    from .gui.main_window import YouTubeDownloaderGUI
+    
     app = QApplication(sys.argv)
     window = YouTubeDownloaderGUI()
     window.show()
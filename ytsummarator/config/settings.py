@@ -1,6 +1,20 @@
 """Configuration management for the summarizer."""
+import atexit
 import json
 import os
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=4)
+def _load(path: str, mtime: float) -> dict:
+    """Parse a config file, reusing the result until the file changes."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 class Config:
     """Configuration management for the summarizer."""
@@ -10,6 +24,14 @@ class Config:
             "output_dir": "Summarator_Output",
             "max_retries": 4,
             "base_delay": 10,
+            "max_concurrent_requests": 10,
+            "video_concurrency": 4,
+            "max_requests_per_minute": 500,
+            "max_tokens_per_minute": 200000,
+            "prompts_per_request": 1,
+            "use_batch_api": False,
+            "batch_poll_interval": 30,
+            "redis_url": None,
             "adaptive_delay_min": 5,
             "adaptive_delay_max": 20,
             "chunk_overlap_ratio": 0.1,
@@ -18,21 +40,24 @@ class Config:
             "default_model": "gpt-3.5-turbo-16k",
             "default_depth": "detailed",
             "max_tokens_per_chunk": 2000,
+            "min_summarize_tokens": 50,
             "max_tokens_final": 1500,
+            "reduce_fanout": 8,
             "temperature": 0.5,
             "timeout": 60,
             "error_logging": True,
             "progress_tracking": True
         }
+        self._dirty = False
+        self._flush_registered = False
         self.config = self.load_config()
     
     def load_config(self) -> dict:
         """Load configuration from file or create default."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return {**self.default_config, **config}
+                config = _load(self.config_file, os.path.getmtime(self.config_file))
+                return {**self.default_config, **config}
             return self.default_config.copy()
         except Exception as e:
             print(f"Error loading config: {str(e)}")
@@ -41,8 +66,12 @@ class Config:
     def save_config(self):
         """Save current configuration to file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(self.config, f, indent=4)
         except Exception as e:
             print(f"Error saving config: {str(e)}")
     
@@ -51,6 +80,15 @@ class Config:
         return self.config.get(key, default)
     
     def set(self, key: str, value):
-        """Set configuration value and save."""
+        """Set configuration value; it is saved by flush() or at exit."""
         self.config[key] = value
-        self.save_config() 
\ No newline at end of file
+        self._dirty = True
+        if not self._flush_registered:
+            self._flush_registered = True
+            atexit.register(self.flush)
+    
+    def flush(self):
+        """Save the configuration if it changed since the last save."""
+        if self._dirty:
+            self._dirty = False
+            self.save_config()
@@ -1,15 +1,70 @@
 """Core YouTube video summarization functionality."""
 import os
-from typing import List, Dict, Optional
+import re
+import json
+import hashlib
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple, NamedTuple
+import httpx
 import openai
+import requests
+import tiktoken
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import TextFormatter
 
 from ..models.summary_depth import SummaryDepth
 from ..config.settings import Config
-from ..services.cache import Cache
+from ..services.cache import Cache, RedisCache
+from ..services.rate_limiter import AsyncRateLimiter
+from ..services.batch_client import submit_batch, wait_for_batch, BatchError
 from ..utils.progress import ProgressTracker
-from ..utils.error import retry_with_backoff
+from ..utils.error import retry_with_backoff, async_retry_with_backoff
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+# Matches watch, youtu.be, shorts and embed URLs, ignoring any query string
+VIDEO_ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([A-Za-z0-9_-]{11})")
+
+INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Shared so title lookups reuse pooled connections instead of a new TLS
+# handshake per video
+_session = requests.Session()
+
+@lru_cache(maxsize=1024)
+def fetch_video_title(video_id: str) -> str:
+    """Fetch a video's title from YouTube's oEmbed endpoint.
+    
+    Successful lookups are cached; failures raise and are retried next time.
+    """
+    response = _session.get(
+        "https://www.youtube.com/oembed",
+        params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+        timeout=5
+    )
+    response.raise_for_status()
+    return response.json()["title"]
+
+@lru_cache(maxsize=8)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for model, cached since loading one is slow."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # tiktoken only knows released model names; newer or fine-tuned ones
+        # tokenize like the o200k family the default models use
+        return tiktoken.get_encoding("o200k_base")
+
+class RequestSession(NamedTuple):
+    """OpenAI client and request limits shared by every chunk in a run."""
+    client: openai.AsyncOpenAI
+    limiter: AsyncRateLimiter
+    semaphore: asyncio.Semaphore
 
 class YouTubeSummarizer:
     """Main class for YouTube video summarization."""
@@ -18,6 +73,7 @@ class YouTubeSummarizer:
         """Initialize the summarizer with configuration."""
         self.config = config or Config()
         self.cache = Cache()
+        self.chunk_cache = RedisCache(self.config.get("redis_url"))
         self.formatter = TextFormatter()
         
         # Set OpenAI API key
@@ -25,17 +81,24 @@ class YouTubeSummarizer:
     
     def get_video_id(self, url: str) -> str:
         """Extract video ID from URL."""
-        if "youtu.be" in url:
-            return url.split("/")[-1]
-        elif "youtube.com" in url:
-            return url.split("v=")[1].split("&")[0]
-        return url
+        match = VIDEO_ID_PATTERN.search(url)
+        return match.group(1) if match else url
+    
+    def get_video_title(self, video_id: str) -> str:
+        """Get a video's title, safe for use in filenames; the ID if it can't be fetched."""
+        try:
+            title = fetch_video_title(video_id)
+        except Exception as e:
+            print(f"Warning: Could not fetch video title: {str(e)}")
+            return video_id
+        return title.translate(INVALID_FILENAME_CHARS).strip()[:100] or video_id
     
     def get_transcript(self, video_id: str) -> List[Dict]:
         """Get video transcript with caching."""
         # Check cache first
-        if self.cache.has_transcript(video_id):
-            return self.cache.get_transcript(video_id)
+        transcript = self.cache.get_transcript(video_id)
+        if transcript is not None:
+            return transcript
         
         # Get transcript from YouTube
         transcript = retry_with_backoff(
@@ -48,29 +111,79 @@ class YouTubeSummarizer:
         self.cache.cache_transcript(video_id, transcript)
         return transcript
     
-    def chunk_transcript(self, transcript: List[Dict]) -> List[str]:
-        """Split transcript into chunks."""
+    def chunk_transcript(self, transcript: List[Dict], model: str = "gpt-3.5-turbo") -> List[Tuple[str, int]]:
+        """Split transcript into chunks of at most max_tokens_per_chunk tokens.
+        
+        Each chunk after the first starts with the last chunk_overlap_ratio of
+        the previous one, so ideas spanning a boundary are seen whole.
+        Returns (chunk text, token count) pairs so callers can reuse the counts.
+        """
+        max_tokens = self.config.get("max_tokens_per_chunk")
+        overlap_tokens = int(max_tokens * self.config.get("chunk_overlap_ratio", 0))
+        segment_texts = [segment["text"] for segment in transcript]
+        # Tokenize every segment in one batched call
+        segment_lengths = map(len, get_encoding(model).encode_ordinary_batch(segment_texts))
+        
         chunks = []
-        current_chunk = []
+        current_chunk = []  # (text, token count) per segment
         current_length = 0
         
-        for segment in transcript:
-            segment_text = segment["text"]
-            segment_length = len(segment_text.split())
-            
-            if current_length + segment_length > self.config.get("chunk_size"):
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [segment_text]
-                current_length = segment_length
+        for segment in zip(segment_texts, segment_lengths):
+            segment_length = segment[1]
+            if current_chunk and current_length + segment_length > max_tokens:
+                chunks.append((" ".join(text for text, _ in current_chunk), current_length))
+                
+                # Carry the trailing segments that fit in the overlap budget
+                overlap = []
+                overlap_length = 0
+                for previous in reversed(current_chunk):
+                    if overlap_length + previous[1] > overlap_tokens:
+                        break
+                    overlap.append(previous)
+                    overlap_length += previous[1]
+                overlap.reverse()
+                
+                current_chunk = overlap + [segment]
+                current_length = overlap_length + segment_length
             else:
-                current_chunk.append(segment_text)
+                current_chunk.append(segment)
                 current_length += segment_length
         
         if current_chunk:
-            chunks.append(" ".join(current_chunk))
+            chunks.append((" ".join(text for text, _ in current_chunk), current_length))
         
         return chunks
     
+    def merge_chunk_summaries(self, chunk_summaries: List[str]) -> str:
+        """Join chunk summaries, dropping lines repeated across a boundary."""
+        if not self.config.get("chunk_overlap_ratio", 0):
+            return "\n\n".join(chunk_summaries)
+        
+        merged = []
+        previous_lines = []
+        for summary in chunk_summaries:
+            lines = summary.splitlines()
+            # Overlapping chunks can produce the same lines at the end of one
+            # summary and the start of the next; keep only the first copy
+            limit = min(len(previous_lines), len(lines))
+            repeated = next(
+                (k for k in range(limit, 0, -1) if previous_lines[-k:] == lines[:k]),
+                0
+            )
+            merged.append("\n".join(lines[repeated:]))
+            previous_lines = lines
+        return "\n\n".join(part for part in merged if part)
+    
+    def get_chunk_key(self, chunk: str, depth: SummaryDepth, model: str, level: int = 0) -> str:
+        """Get the content-addressed cache key for a chunk summary.
+        
+        Level 0 is a transcript chunk; higher levels are merged summaries.
+        """
+        key_source = f"{chunk}|{model}|{depth.value}|{self.config.get('temperature')}"
+        if level:
+            key_source += f"|{level}"
+        return "chunk:" + hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+    
     def get_summary_prompt(self, chunk: str, depth: SummaryDepth) -> str:
         """Get appropriate prompt based on summary depth."""
         prompts = {
@@ -80,64 +193,443 @@ class YouTubeSummarizer:
         }
         return prompts[depth].format(text=chunk)
     
-    def summarize_chunk(
+    async def complete(
         self,
-        chunk: str,
-        depth: SummaryDepth,
-        model: str
+        client: openai.AsyncOpenAI,
+        limiter: AsyncRateLimiter,
+        messages: List[Dict],
+        model: str,
+        max_tokens: Optional[int]
     ) -> str:
-        """Summarize a single chunk of text."""
-        prompt = self.get_summary_prompt(chunk, depth)
+        """Send one rate-limited chat completion request with retries."""
+        # Rough cost of the request: prompt words plus the completion budget
+        prompt_words = sum(len(message["content"].split()) for message in messages)
+        estimated_tokens = int(prompt_words * 1.3) + (max_tokens or 0)
         
-        response = retry_with_backoff(
-            lambda: openai.ChatCompletion.create(
+        async def request():
+            # Every attempt, retries included, spends from the rate budget
+            waited = await limiter.acquire(estimated_tokens)
+            if waited and self.config.get("error_logging"):
+                print(f"\nRate limit budget reached, waited {waited:.1f}s")
+            return await client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=self.config.get("temperature"),
-                max_tokens=self.config.get("max_tokens")
-            ),
+                max_tokens=max_tokens
+            )
+        
+        response = await async_retry_with_backoff(
+            request,
             max_retries=self.config.get("max_retries"),
             base_delay=self.config.get("base_delay")
         )
         
         return response.choices[0].message.content.strip()
     
-    def summarize_video(
+    async def asummarize_chunk(
         self,
-        url: str,
-        depth: SummaryDepth = SummaryDepth.DETAILED,
-        model: str = "gpt-3.5-turbo"
+        client: openai.AsyncOpenAI,
+        limiter: AsyncRateLimiter,
+        chunk: str,
+        depth: SummaryDepth,
+        model: str
     ) -> str:
-        """Generate summary for a YouTube video."""
-        video_id = self.get_video_id(url)
+        """Summarize a single chunk of text."""
+        prompt = self.get_summary_prompt(chunk, depth)
+        return await self.complete(
+            client, limiter,
+            [{"role": "user", "content": prompt}],
+            model, self.config.get("max_tokens")
+        )
+    
+    async def asummarize_chunk_batch(
+        self,
+        client: openai.AsyncOpenAI,
+        limiter: AsyncRateLimiter,
+        chunks: List[str],
+        depth: SummaryDepth,
+        model: str
+    ) -> List[str]:
+        """Summarize several chunks in one request, one summary per chunk."""
+        if len(chunks) == 1:
+            return [await self.asummarize_chunk(client, limiter, chunks[0], depth, model)]
         
-        # Check cache for existing summary
-        if self.cache.has_summary(video_id, depth.value, model):
-            return self.cache.get_summary(video_id, depth.value, model)
+        system_prompt = (
+            f"You will receive {len(chunks)} transcript segments, each starting with a "
+            f"###SEG i### line. Follow the instructions in each segment independently. "
+            f"Reply with only a JSON array of {len(chunks)} strings, one result per "
+            f"segment, in segment order."
+        )
+        user_prompt = "\n\n".join(
+            f"###SEG {i}###\n{self.get_summary_prompt(chunk, depth)}"
+            for i, chunk in enumerate(chunks, 1)
+        )
+        max_tokens = self.config.get("max_tokens")
         
-        # Get and chunk transcript
-        transcript = self.get_transcript(video_id)
-        chunks = self.chunk_transcript(transcript)
+        content = await self.complete(
+            client, limiter,
+            [{"role": "system", "content": system_prompt},
+             {"role": "user", "content": user_prompt}],
+            model, max_tokens * len(chunks) if max_tokens else None
+        )
+        
+        try:
+            summaries = json.loads(content)
+            if (isinstance(summaries, list) and len(summaries) == len(chunks)
+                    and all(isinstance(summary, str) for summary in summaries)):
+                return [summary.strip() for summary in summaries]
+        except json.JSONDecodeError:
+            pass
         
-        # Initialize progress tracker
+        # The reply didn't split cleanly; fall back to one request per chunk
+        if self.config.get("error_logging"):
+            print(f"\nCould not parse batched reply, summarizing {len(chunks)} chunks separately")
+        return await asyncio.gather(*(
+            self.asummarize_chunk(client, limiter, chunk, depth, model) for chunk in chunks
+        ))
+    
+    @asynccontextmanager
+    async def request_session(self):
+        """Open the client, rate limits and chunk cache for one run."""
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrent_requests", 10))
+        limiter = AsyncRateLimiter(self.config.get("max_requests_per_minute", 500),
+                                   self.config.get("max_tokens_per_minute", 200000))
+        # One pooled connection set for every request in the run, multiplexed
+        # over HTTP/2 when h2 is installed. The transport retries failed
+        # connects itself, leaving retry_with_backoff for API errors
+        transport = httpx.AsyncHTTPTransport(
+            http2=h2 is not None,
+            retries=2,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+        )
+        http_client = httpx.AsyncClient(transport=transport, timeout=self.config.get("timeout"))
+        async with openai.AsyncOpenAI(api_key=self.config.get("openai_api_key"),
+                                      http_client=http_client) as client, \
+                self.chunk_cache:
+            yield RequestSession(client, limiter, semaphore)
+    
+    async def summarize_chunks(
+        self,
+        session: RequestSession,
+        chunks: List[Tuple[str, int]],
+        depth: SummaryDepth,
+        model: str
+    ) -> List[str]:
+        """Summarize all chunks concurrently, returning summaries in chunk order."""
         progress = ProgressTracker(len(chunks))
+        completed = 0
+        
+        # Optionally pack consecutive chunks into one request to save on
+        # requests per minute when chunks are small
+        batch_size = max(1, self.config.get("prompts_per_request", 1))
+        batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+        # A chunk this short (usually the tail of the transcript) is kept as
+        # is rather than spending a request on summarizing it
+        min_tokens = self.config.get("min_summarize_tokens", 50)
+        
+        async def summarize(batch: List[Tuple[str, int]]) -> List[str]:
+            nonlocal completed
+            # Only send the chunks that haven't been summarized before
+            keys = [self.get_chunk_key(text, depth, model) for text, _ in batch]
+            summaries = [
+                text if token_count < min_tokens else await self.chunk_cache.get(key)
+                for (text, token_count), key in zip(batch, keys)
+            ]
+            pending = [i for i, summary in enumerate(summaries) if summary is None]
+            if pending:
+                async with session.semaphore:
+                    fresh = await self.asummarize_chunk_batch(
+                        session.client, session.limiter,
+                        [batch[i][0] for i in pending], depth, model
+                    )
+                for i, summary in zip(pending, fresh):
+                    summaries[i] = summary
+                    await self.chunk_cache.setex(keys[i], summary)
+            for _, token_count in batch:
+                progress.update(completed, token_count)
+                completed += 1
+            return summaries
         
-        # Generate summaries for each chunk
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks):
-            summary = self.summarize_chunk(chunk, depth, model)
-            chunk_summaries.append(summary)
-            progress.update(i, len(chunk.split()))
+        batch_summaries = await asyncio.gather(*(summarize(batch) for batch in batches))
         
-        # Combine summaries
-        final_summary = "\n\n".join(chunk_summaries)
         progress.complete()
+        return [summary for summaries in batch_summaries for summary in summaries]
+    
+    async def reduce_summaries(
+        self,
+        session: RequestSession,
+        summaries: List[str],
+        depth: SummaryDepth,
+        model: str
+    ) -> str:
+        """Merge chunk summaries, summarizing groups of them until the result fits max_tokens_final."""
+        max_tokens = self.config.get("max_tokens_final")
+        fanout = max(2, self.config.get("reduce_fanout", 8))
+        encoding = get_encoding(model)
+        
+        async def summarize_group(text: str, level: int) -> str:
+            key = self.get_chunk_key(text, depth, model, level)
+            summary = await self.chunk_cache.get(key)
+            if summary is None:
+                async with session.semaphore:
+                    summary = await self.asummarize_chunk(
+                        session.client, session.limiter, text, depth, model
+                    )
+                await self.chunk_cache.setex(key, summary)
+            return summary
+        
+        merged = self.merge_chunk_summaries(summaries)
+        level = 0
+        # Each level summarizes groups of up to fanout summaries at once, so
+        # the number left shrinks by that factor until the result is short enough
+        while len(summaries) > 1 and len(encoding.encode_ordinary(merged)) > max_tokens:
+            level += 1
+            groups = [
+                self.merge_chunk_summaries(summaries[i:i + fanout])
+                for i in range(0, len(summaries), fanout)
+            ]
+            summaries = await asyncio.gather(*(summarize_group(group, level) for group in groups))
+            merged = "\n\n".join(summaries)
+        
+        return merged
+    
+    async def summarize_chunks_batch_api(
+        self,
+        chunk_lists: List[List[Tuple[str, int]]],
+        depth: SummaryDepth,
+        model: str
+    ) -> List[List[Optional[str]]]:
+        """Summarize the chunks of several videos through one OpenAI Batch API job.
+        
+        Returns each video's summaries in chunk order, with None for any chunk
+        the batch returned no result for. Chunks already in the chunk cache
+        and ones below min_summarize_tokens are filled in without being sent.
+        """
+        min_tokens = self.config.get("min_summarize_tokens", 50)
+        summaries = []
+        batch_requests = []
+        # Cache key of each submitted chunk and where its summary goes
+        pending = {}
+        for video_index, chunks in enumerate(chunk_lists):
+            video_summaries = []
+            for chunk_index, (chunk, token_count) in enumerate(chunks):
+                key = self.get_chunk_key(chunk, depth, model)
+                summary = chunk if token_count < min_tokens else await self.chunk_cache.get(key)
+                if summary is None:
+                    custom_id = f"video-{video_index}-chunk-{chunk_index}"
+                    pending[custom_id] = (video_index, chunk_index, key)
+                    batch_requests.append({
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": model,
+                            "messages": [{"role": "user", "content": self.get_summary_prompt(chunk, depth)}],
+                            "temperature": self.config.get("temperature"),
+                            "max_tokens": self.config.get("max_tokens")
+                        }
+                    })
+                video_summaries.append(summary)
+            summaries.append(video_summaries)
+        
+        if not batch_requests:
+            return summaries
+        
+        def run_batch() -> Dict[str, str]:
+            # Submitting and polling block for minutes to hours, so they run
+            # in a worker thread
+            client = openai.OpenAI(api_key=self.config.get("openai_api_key"))
+            batch_id = submit_batch(client, batch_requests)
+            print(f"Submitted batch {batch_id} with {len(batch_requests)} chunks "
+                  f"from {len(chunk_lists)} videos, waiting for results...")
+            return wait_for_batch(client, batch_id, self.config.get("batch_poll_interval", 30))
+        
+        results = await asyncio.to_thread(run_batch)
+        for custom_id, (video_index, chunk_index, key) in pending.items():
+            summary = results.get(custom_id)
+            if summary is not None:
+                summaries[video_index][chunk_index] = summary
+                await self.chunk_cache.setex(key, summary)
+        return summaries
+    
+    async def prepare_video(
+        self,
+        url: str,
+        depth: SummaryDepth,
+        model: str
+    ) -> Tuple[str, Optional[str], List[Tuple[str, int]]]:
+        """Return a video's ID and either its cached summary or its transcript chunks."""
+        video_id = self.get_video_id(url)
+        
+        # Check cache for existing summary
+        summary = self.cache.get_summary(video_id, depth.value, model)
+        if summary is not None:
+            return video_id, summary, []
+        
+        # Get and chunk transcript; the fetch blocks, so keep it off the loop
+        # to let other videos' requests proceed meanwhile
+        transcript = await asyncio.to_thread(self.get_transcript, video_id)
+        return video_id, None, self.chunk_transcript(transcript, model)
+    
+    async def finish_video(
+        self,
+        session: RequestSession,
+        video_id: str,
+        chunk_summaries: List[Optional[str]],
+        depth: SummaryDepth,
+        model: str
+    ) -> str:
+        """Reduce a video's chunk summaries to its final summary and cache it."""
+        missing = [i for i, summary in enumerate(chunk_summaries) if summary is None]
+        if missing:
+            raise BatchError(f"Batch returned no result for chunks {missing} of {video_id}")
+        
+        # Combine summaries, condensing them further if they run long
+        final_summary = await self.reduce_summaries(session, chunk_summaries, depth, model)
         
         # Cache the summary
         self.cache.cache_summary(video_id, depth.value, model, final_summary)
         
         return final_summary
     
+    async def summarize_video_async(
+        self,
+        session: RequestSession,
+        url: str,
+        depth: SummaryDepth,
+        model: str
+    ) -> str:
+        """Generate summary for a YouTube video within a request session."""
+        video_id, summary, chunks = await self.prepare_video(url, depth, model)
+        if summary is not None:
+            return summary
+        
+        if self.config.get("use_batch_api"):
+            # Slower to return, but half the cost and outside the rate limits
+            chunk_summaries = (await self.summarize_chunks_batch_api([chunks], depth, model))[0]
+        else:
+            # Chunks are independent, so request them all at once; the semaphore
+            # and rate limiter keep the burst inside the account's limits
+            chunk_summaries = await self.summarize_chunks(session, chunks, depth, model)
+        
+        return await self.finish_video(session, video_id, chunk_summaries, depth, model)
+    
+    def summarize_video(
+        self,
+        url: str,
+        depth: SummaryDepth = SummaryDepth.DETAILED,
+        model: str = "gpt-3.5-turbo"
+    ) -> str:
+        """Generate summary for a YouTube video."""
+        async def run():
+            async with self.request_session() as session:
+                return await self.summarize_video_async(session, url, depth, model)
+        
+        try:
+            return asyncio.run(run())
+        finally:
+            self.cache.flush()
+    
+    async def summarize_videos_async(
+        self,
+        urls: List[str],
+        depth: SummaryDepth,
+        model: str,
+        on_complete: Optional[Callable[[str, Optional[str], Optional[Exception]], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None
+    ) -> List[Optional[str]]:
+        """Summarize several videos concurrently, sharing one request session.
+        
+        on_complete(url, summary, error) is called on the event loop as each
+        video finishes; without it, errors are printed. Videos that haven't
+        started are skipped once cancelled() returns True. With use_batch_api,
+        the chunks of every video go into a single batch.
+        """
+        video_semaphore = asyncio.Semaphore(self.config.get("video_concurrency", 4))
+        results = [None] * len(urls)
+        
+        def report(index: int, summary: Optional[str], error: Optional[Exception]):
+            results[index] = summary
+            if on_complete is not None:
+                on_complete(urls[index], summary, error)
+            elif error is not None:
+                print(f"\nError summarizing {urls[index]}: {str(error)}")
+        
+        async with self.request_session() as session:
+            if not self.config.get("use_batch_api"):
+                async def summarize(index: int):
+                    async with video_semaphore:
+                        if cancelled is not None and cancelled():
+                            return
+                        summary = error = None
+                        try:
+                            summary = await self.summarize_video_async(session, urls[index], depth, model)
+                        except Exception as e:
+                            error = e
+                        report(index, summary, error)
+                
+                await asyncio.gather(*(summarize(index) for index in range(len(urls))))
+                return results
+            
+            # Batch mode: fetch every transcript first, so one batch carries
+            # the whole run instead of one batch per video
+            async def prepare(index: int):
+                async with video_semaphore:
+                    if cancelled is not None and cancelled():
+                        return None
+                    try:
+                        video_id, summary, chunks = await self.prepare_video(urls[index], depth, model)
+                    except Exception as e:
+                        report(index, None, e)
+                        return None
+                    if summary is not None:
+                        report(index, summary, None)
+                        return None
+                    return index, video_id, chunks
+            
+            prepared = [video for video in await asyncio.gather(*(prepare(index) for index in range(len(urls))))
+                        if video is not None]
+            if not prepared:
+                return results
+            
+            try:
+                chunk_lists = await self.summarize_chunks_batch_api(
+                    [chunks for _, _, chunks in prepared], depth, model
+                )
+            except Exception as e:
+                for index, _, _ in prepared:
+                    report(index, None, e)
+                return results
+            
+            async def finish(index: int, video_id: str, chunk_summaries: List[Optional[str]]):
+                async with video_semaphore:
+                    summary = error = None
+                    try:
+                        summary = await self.finish_video(session, video_id, chunk_summaries, depth, model)
+                    except Exception as e:
+                        error = e
+                    report(index, summary, error)
+            
+            await asyncio.gather(*(
+                finish(index, video_id, chunk_summaries)
+                for (index, video_id, _), chunk_summaries in zip(prepared, chunk_lists)
+            ))
+            return results
+    
+    def summarize_videos(
+        self,
+        urls: List[str],
+        depth: SummaryDepth = SummaryDepth.DETAILED,
+        model: str = "gpt-3.5-turbo",
+        on_complete: Optional[Callable[[str, Optional[str], Optional[Exception]], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None
+    ) -> List[Optional[str]]:
+        """Generate summaries for several videos, None where one failed."""
+        try:
+            return asyncio.run(self.summarize_videos_async(urls, depth, model, on_complete, cancelled))
+        finally:
+            self.cache.flush()
+    
     def save_summary(
         self,
         summary: str,
@@ -155,4 +647,13 @@ class YouTubeSummarizer:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(summary)
         
-        print(f"\nSummary saved to: {filepath}") 
\ No newline at end of file
+        print(f"\nSummary saved to: {filepath}") 
+
+@lru_cache(maxsize=1)
+def get_summarizer() -> YouTubeSummarizer:
+    """Get the summarizer shared across the process, created on first use.
+    
+    Sharing it keeps one cache index and one pool of HTTP connections
+    for every worker and title lookup.
+    """
+    return YouTubeSummarizer()
@@ -1,5 +1,18 @@
 """GUI components for the YouTube Summarator."""
-from .main_window import YouTubeDownloaderGUI
-from .themes import get_matrix_stylesheet, get_dark_stylesheet, AVAILABLE_THEMES
+import importlib
 
-__all__ = ['YouTubeDownloaderGUI', 'get_matrix_stylesheet', 'get_dark_stylesheet', 'AVAILABLE_THEMES'] 
\ No newline at end of file
+# Loaded on first access so importing the package doesn't pull in Qt
+_LAZY_ATTRIBUTES = {
+    'YouTubeDownloaderGUI': '.main_window',
+    'get_matrix_stylesheet': '.themes',
+    'get_dark_stylesheet': '.themes',
+    'AVAILABLE_THEMES': '.themes',
+}
+
+__all__ = ['YouTubeDownloaderGUI', 'get_matrix_stylesheet', 'get_dark_stylesheet', 'AVAILABLE_THEMES']
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 import os
 import sys
 import json
+from functools import partial
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QComboBox, QTextEdit,
@@ -9,18 +10,34 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QMenuBar,
     QMenu, QStatusBar, QCheckBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QMimeData, QUrl
+from PyQt6.QtCore import Qt, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QAction, QDragEnterEvent, QDropEvent
-from .workers import DownloadWorker, TranscriptWorker, SummaryWorker
-from .themes import get_matrix_stylesheet, get_dark_stylesheet, AVAILABLE_THEMES
+from .themes import THEME_LOADERS, THEME_MENU_ITEMS
 from ..models.summary_depth import SummaryDepth
 from ..config.settings import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Config file for storing user preferences
 CONFIG_FILE = os.path.expanduser("~/.youtube_extractor_config.json")
 
+# Summary depth choices for the depth combo, in enum order
+_DEPTH_VALUES = tuple(d.value for d in SummaryDepth)
+
+# Serialized form of the config as last read or written, so saves that
+# change nothing can skip the write
+_saved_data = None
+
+def serialize_config(config):
+    """Serialize the configuration to JSON bytes."""
+    return orjson.dumps(config) if orjson is not None else json.dumps(config).encode('utf-8')
+
 def load_config():
     """Load configuration from file."""
+    global _saved_data
     default_config = {
         "last_output_folder": "",
         "last_format": "mp4",
@@ -34,25 +51,64 @@ def load_config():
     
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                # Ensure all default keys exist
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                return config
+            with open(CONFIG_FILE, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+            # Ensure all default keys exist
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
+            _saved_data = serialize_config(config)
+            return config
         except Exception as e:
             print(f"Error loading config: {e}")
     return default_config
 
+def get_summarizer():
+    """Get the summarizer shared by title lookups and workers."""
+    # Imported here so yt-dlp, openai and the transcript API load only when
+    # a title is first fetched, not when the window opens
+    from ..core.summarizer import get_summarizer as get_shared_summarizer
+    return get_shared_summarizer()
+
 def save_config(config):
-    """Save configuration to file."""
+    """Save configuration to file, skipping the write if nothing changed."""
+    global _saved_data
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
+        data = serialize_config(config)
+        if data == _saved_data:
+            return
+        # Write a temporary file and swap it in, so a crash mid-write
+        # can't leave a truncated config behind
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, CONFIG_FILE)
+        _saved_data = data
     except Exception as e:
         print(f"Error saving config: {e}")
 
+class TitleFetcher(QRunnable):
+    """Look up one video title on a thread pool and report it by signal."""
+    
+    def __init__(self, row, url, title_signal):
+        super().__init__()
+        self.row = row
+        self.url = url
+        self.title_signal = title_signal
+    
+    def run(self):
+        """Fetch the title and emit it for the row."""
+        try:
+            summarizer = get_summarizer()
+            video_id = summarizer.get_video_id(self.url)
+            if video_id:
+                title = summarizer.get_video_title(video_id)
+                if title:
+                    self.title_signal.emit(self.row, title)
+        except Exception as e:
+            self.title_signal.emit(self.row, f"Error: {str(e)}")
+
 class YouTubeDownloaderGUI(QMainWindow):
     """Main window for the YouTube Summarator application."""
     
@@ -68,12 +124,30 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.config = load_config()
         self.setMinimumSize(self.config["window_width"], self.config["window_height"])
         
+        # Coalesce bursts of preference changes (e.g. a resize drag) into
+        # one write once they settle
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(lambda: save_config(self.config))
+        
         # Initialize UI
         self.init_ui()
         
         # Set up theme
         self.apply_theme(self.config["theme"])
         
+        # Worker messages are buffered and appended at most every 50 ms
+        self._status_buffer = []
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self.flush_status)
+        
+        # Title lookups share a few threads instead of one thread per URL
+        self.title_pool = QThreadPool(self)
+        self.title_pool.setMaxThreadCount(8)
+        
         # Initialize workers
         self.download_worker = None
         self.transcript_worker = None
@@ -111,6 +185,11 @@ class YouTubeDownloaderGUI(QMainWindow):
             self.url_table.setItem(row, 0, QTableWidgetItem(""))
             self.url_table.setItem(row, 1, QTableWidgetItem(""))
         
+        # URL column mirrored as a plain list, one entry per row, so actions
+        # don't have to walk the table items
+        self._urls = [""] * 5
+        self.url_table.itemChanged.connect(self.sync_url, Qt.ConnectionType.DirectConnection)
+        
         # Add URL table buttons
         table_buttons_layout = QHBoxLayout()
         add_row_button = QPushButton("Add Row")
@@ -136,7 +215,9 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.format_combo = QComboBox()
         self.format_combo.addItems(["mp4", "mp3", "m4a", "webm", "mkv"])
         self.format_combo.setCurrentText(self.config["last_format"])
-        self.format_combo.currentTextChanged.connect(self.save_format_preference)
+        self.format_combo.currentTextChanged.connect(
+            self.save_format_preference, Qt.ConnectionType.DirectConnection
+        )
         format_layout.addWidget(self.format_combo)
         options_layout.addLayout(format_layout)
         
@@ -146,7 +227,9 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.quality_combo = QComboBox()
         self.quality_combo.addItems(["best", "1080p", "720p", "480p", "360p"])
         self.quality_combo.setCurrentText(self.config["last_quality"])
-        self.quality_combo.currentTextChanged.connect(self.save_quality_preference)
+        self.quality_combo.currentTextChanged.connect(
+            self.save_quality_preference, Qt.ConnectionType.DirectConnection
+        )
         quality_layout.addWidget(self.quality_combo)
         options_layout.addLayout(quality_layout)
         
@@ -154,9 +237,11 @@ class YouTubeDownloaderGUI(QMainWindow):
         depth_layout = QHBoxLayout()
         depth_layout.addWidget(QLabel("Summary Depth:"))
         self.depth_combo = QComboBox()
-        self.depth_combo.addItems([d.value for d in SummaryDepth])
+        self.depth_combo.addItems(_DEPTH_VALUES)
         self.depth_combo.setCurrentText(self.config["last_depth"])
-        self.depth_combo.currentTextChanged.connect(self.save_depth_preference)
+        self.depth_combo.currentTextChanged.connect(
+            self.save_depth_preference, Qt.ConnectionType.DirectConnection
+        )
         depth_layout.addWidget(self.depth_combo)
         options_layout.addLayout(depth_layout)
         
@@ -166,7 +251,9 @@ class YouTubeDownloaderGUI(QMainWindow):
         self.model_combo = QComboBox()
         self.model_combo.addItems(["gpt-3.5-turbo", "gpt-4"])
         self.model_combo.setCurrentText(self.config["last_model"])
-        self.model_combo.currentTextChanged.connect(self.save_model_preference)
+        self.model_combo.currentTextChanged.connect(
+            self.save_model_preference, Qt.ConnectionType.DirectConnection
+        )
         model_layout.addWidget(self.model_combo)
         options_layout.addLayout(model_layout)
         
@@ -180,9 +267,12 @@ class YouTubeDownloaderGUI(QMainWindow):
         title_layout.addWidget(self.custom_title_input)
         options_layout.addLayout(title_layout)
         
-        # Connect custom title checkbox
+        # Connect custom title checkbox. The option widgets only ever emit on
+        # the GUI thread, so their handlers are connected directly; worker
+        # signals keep the default connection and are queued across threads.
         self.custom_title_check.stateChanged.connect(
-            lambda state: self.custom_title_input.setEnabled(state == Qt.CheckState.Checked.value)
+            lambda state: self.custom_title_input.setEnabled(state == Qt.CheckState.Checked.value),
+            Qt.ConnectionType.DirectConnection
         )
         
         options_group.setLayout(options_layout)
@@ -262,9 +352,9 @@ class YouTubeDownloaderGUI(QMainWindow):
         # Theme menu
         theme_menu = menubar.addMenu("Theme")
         
-        for theme in AVAILABLE_THEMES:
-            theme_action = QAction(theme.capitalize(), self)
-            theme_action.triggered.connect(lambda checked, t=theme: self.apply_theme(t))
+        for theme, label in THEME_MENU_ITEMS:
+            theme_action = QAction(label, self)
+            theme_action.triggered.connect(partial(self.apply_theme, theme))
             theme_menu.addAction(theme_action)
         
         # Help menu
@@ -278,6 +368,7 @@ class YouTubeDownloaderGUI(QMainWindow):
         """Add a new row to the URL table."""
         row = self.url_table.rowCount()
         self.url_table.insertRow(row)
+        self._urls.append("")
         self.url_table.setItem(row, 0, QTableWidgetItem(""))
         self.url_table.setItem(row, 1, QTableWidgetItem(""))
     
@@ -286,6 +377,12 @@ class YouTubeDownloaderGUI(QMainWindow):
         rows = set(item.row() for item in self.url_table.selectedItems())
         for row in sorted(rows, reverse=True):
             self.url_table.removeRow(row)
+            del self._urls[row]
+    
+    def sync_url(self, item):
+        """Mirror an edited URL cell into the URL list."""
+        if item.column() == 0 and 0 <= item.row() < len(self._urls):
+            self._urls[item.row()] = item.text().strip()
     
     def show_table_context_menu(self, position):
         """Show context menu for the URL table."""
@@ -305,34 +402,27 @@ class YouTubeDownloaderGUI(QMainWindow):
         if mime_data.hasText():
             text = mime_data.text().strip()
             if text:
-                self.url_table.setItem(row, column, QTableWidgetItem(text))
+                self.set_cell_text(row, column, text)
                 if column == 0:  # URL column
                     self.fetch_video_title(row, text)
     
+    def set_cell_text(self, row, column, text):
+        """Set a cell's text, reusing its item when there is one."""
+        item = self.url_table.item(row, column)
+        if item:
+            item.setText(text)
+        else:
+            self.url_table.setItem(row, column, QTableWidgetItem(text))
+    
     def fetch_video_title(self, row, url):
         """Fetch video title for the given URL."""
-        def fetch_title():
-            try:
-                from ..core.summarizer import YouTubeSummarizer
-                summarizer = YouTubeSummarizer()
-                video_id = summarizer.get_video_id(url)
-                if video_id:
-                    title = summarizer.get_video_title(video_id)
-                    if title:
-                        self.update_title_signal.emit(row, title)
-            except Exception as e:
-                self.update_title_signal.emit(row, f"Error: {str(e)}")
-        
-        # Start title fetch in a separate thread
-        thread = QThread()
-        thread.run = fetch_title
-        thread.start()
+        self.title_pool.start(TitleFetcher(row, url, self.update_title_signal))
     
     @pyqtSlot(int, str)
     def update_title_cell(self, row, title):
         """Update the title cell in the URL table."""
         if 0 <= row < self.url_table.rowCount():
-            self.url_table.setItem(row, 1, QTableWidgetItem(title))
+            self.set_cell_text(row, 1, title)
     
     def open_urls_file(self):
         """Open a file containing URLs."""
@@ -351,52 +441,60 @@ class YouTubeDownloaderGUI(QMainWindow):
             with open(file_path, 'r') as f:
                 urls = [line.strip() for line in f if line.strip()]
             
-            self.url_table.setRowCount(len(urls))
+            # Fill the table with repaints and item signals suspended so the
+            # whole load costs one relayout instead of one per row
+            self.url_table.setUpdatesEnabled(False)
+            self.url_table.blockSignals(True)
+            try:
+                self.url_table.setRowCount(len(urls))
+                self._urls = list(urls)
+                for i, url in enumerate(urls):
+                    self.url_table.setItem(i, 0, QTableWidgetItem(url))
+                    # Clear titles left over from rows that were already there
+                    self.url_table.setItem(i, 1, QTableWidgetItem(""))
+            finally:
+                self.url_table.blockSignals(False)
+                self.url_table.setUpdatesEnabled(True)
+            
             for i, url in enumerate(urls):
-                self.url_table.setItem(i, 0, QTableWidgetItem(url))
                 self.fetch_video_title(i, url)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load URLs: {str(e)}")
     
     def get_urls_from_table(self):
         """Get all URLs from the table."""
-        urls = []
-        for row in range(self.url_table.rowCount()):
-            url_item = self.url_table.item(row, 0)
-            if url_item and url_item.text().strip():
-                urls.append(url_item.text().strip())
-        return urls
-    
-    def apply_theme(self, theme_name):
+        return [url for url in self._urls if url]
+    
+    def apply_theme(self, theme_name, checked=False):
         """Apply the selected theme."""
-        if theme_name == "matrix":
-            self.setStyleSheet(get_matrix_stylesheet())
-        elif theme_name == "dark":
-            self.setStyleSheet(get_dark_stylesheet())
+        # Setting a stylesheet repolishes every widget; skip it when the
+        # chosen theme is already showing
+        if theme_name == self.config.get("theme") and self.styleSheet():
+            return
+        
+        loader = THEME_LOADERS.get(theme_name)
+        if loader:
+            self.setStyleSheet(loader())
         
         # Save theme preference
         self.config["theme"] = theme_name
-        save_config(self.config)
+        self._save_timer.start()
     
     def save_format_preference(self, format_type):
-        """Save format preference."""
+        """Remember format preference; it is written on close or on start."""
         self.config["last_format"] = format_type
-        save_config(self.config)
     
     def save_quality_preference(self, quality):
-        """Save quality preference."""
+        """Remember quality preference; it is written on close or on start."""
         self.config["last_quality"] = quality
-        save_config(self.config)
     
     def save_depth_preference(self, depth):
-        """Save depth preference."""
+        """Remember depth preference; it is written on close or on start."""
         self.config["last_depth"] = depth
-        save_config(self.config)
     
     def save_model_preference(self, model):
-        """Save model preference."""
+        """Remember model preference; it is written on close or on start."""
         self.config["last_model"] = model
-        save_config(self.config)
     
     def browse_output_folder(self):
         """Open folder browser dialog."""
@@ -408,15 +506,42 @@ class YouTubeDownloaderGUI(QMainWindow):
         if folder:
             self.output_folder_input.setText(folder)
             self.config["last_output_folder"] = folder
-            save_config(self.config)
+            self._save_timer.start()
+    
+    def persist_config(self):
+        """Write the configuration now, cancelling any pending timed save."""
+        self._save_timer.stop()
+        save_config(self.config)
     
     def update_status(self, message):
-        """Update the status text."""
-        self.status_text.append(message)
+        """Queue a message for the status text; flush_status appends it shortly."""
+        self._status_buffer.append(message)
+        # Don't restart a running timer, or a steady stream would never flush
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def update_status_batch(self, messages):
+        """Queue a batch of worker messages for the status text."""
+        self._status_buffer.extend(messages)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def flush_status(self):
+        """Append all buffered messages to the status text in a single update."""
+        if not self._status_buffer:
+            return
+        self.status_text.append("\n".join(self._status_buffer))
+        self._status_buffer.clear()
         self.status_text.verticalScrollBar().setValue(
             self.status_text.verticalScrollBar().maximum()
         )
     
+    def clear_status(self):
+        """Clear the status text, dropping any messages still buffered."""
+        self._status_timer.stop()
+        self._status_buffer.clear()
+        self.status_text.clear()
+    
     def start_download(self):
         """Start the download process."""
         urls = self.get_urls_from_table()
@@ -429,6 +554,11 @@ class YouTubeDownloaderGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select an output folder")
             return
         
+        # Persist the chosen options before a long run in case it crashes
+        self.persist_config()
+        
+        from .workers import DownloadWorker
+        
         # Create download worker
         self.download_worker = DownloadWorker(
             urls[0],  # For now, we'll handle one URL at a time
@@ -445,7 +575,7 @@ class YouTubeDownloaderGUI(QMainWindow):
         # Start download
         self.download_button.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.status_text.clear()
+        self.clear_status()
         self.download_worker.start()
     
     def start_transcript(self):
@@ -460,17 +590,22 @@ class YouTubeDownloaderGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select an output folder")
             return
         
+        # Persist the chosen options before a long run in case it crashes
+        self.persist_config()
+        
+        from .workers import TranscriptWorker
+        
         # Create transcript worker
         self.transcript_worker = TranscriptWorker(urls, output_folder)
         
         # Connect signals
-        self.transcript_worker.progress.connect(self.update_status)
+        self.transcript_worker.progress.connect(self.update_status_batch)
         self.transcript_worker.finished.connect(self.transcript_finished)
         
         # Start transcript generation
         self.transcript_button.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.status_text.clear()
+        self.clear_status()
         self.transcript_worker.start()
     
     def start_summary(self):
@@ -485,26 +620,32 @@ class YouTubeDownloaderGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select an output folder")
             return
         
+        # Persist the chosen options before a long run in case it crashes
+        self.persist_config()
+        
+        from .workers import SummaryWorker
+        
         # Create summary worker
         self.summary_worker = SummaryWorker(
             urls,
             output_folder,
-            SummaryDepth(self.depth_combo.currentText()),
+            SummaryDepth.from_str(self.depth_combo.currentText()),
             self.model_combo.currentText()
         )
         
         # Connect signals
-        self.summary_worker.progress.connect(self.update_status)
+        self.summary_worker.progress.connect(self.update_status_batch)
         self.summary_worker.finished.connect(self.summary_finished)
         
         # Start summary generation
         self.summary_button.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.status_text.clear()
+        self.clear_status()
         self.summary_worker.start()
     
     def download_finished(self, success, message):
         """Handle download completion."""
+        self.flush_status()
         self.download_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage(message)
@@ -516,6 +657,7 @@ class YouTubeDownloaderGUI(QMainWindow):
     
     def transcript_finished(self, success, message):
         """Handle transcript generation completion."""
+        self.flush_status()
         self.transcript_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage(message)
@@ -527,6 +669,7 @@ class YouTubeDownloaderGUI(QMainWindow):
     
     def summary_finished(self, success, message):
         """Handle summary generation completion."""
+        self.flush_status()
         self.summary_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage(message)
@@ -555,25 +698,47 @@ class YouTubeDownloaderGUI(QMainWindow):
     def dropEvent(self, event: QDropEvent):
         """Handle drop event."""
         urls = [url.toLocalFile() for url in event.mimeData().urls()]
-        for url in urls:
-            if url.endswith('.txt'):
-                self.load_urls_from_file(url)
-            else:
-                row = self.url_table.rowCount()
-                self.url_table.insertRow(row)
-                self.url_table.setItem(row, 0, QTableWidgetItem(url))
-                self.fetch_video_title(row, url)
+        url_files = [url for url in urls if url.endswith('.txt')]
+        new_urls = [url for url in urls if not url.endswith('.txt')]
+        
+        # URL files replace the table contents, so load them first
+        for url_file in url_files:
+            self.load_urls_from_file(url_file)
+        
+        if not new_urls:
+            return
+        
+        # Grow the table once and fill the new rows with repaints and item
+        # signals suspended
+        base = self.url_table.rowCount()
+        self.url_table.setUpdatesEnabled(False)
+        self.url_table.blockSignals(True)
+        try:
+            self.url_table.setRowCount(base + len(new_urls))
+            self._urls.extend(new_urls)
+            for i, url in enumerate(new_urls, base):
+                self.url_table.setItem(i, 0, QTableWidgetItem(url))
+                self.url_table.setItem(i, 1, QTableWidgetItem(""))
+        finally:
+            self.url_table.blockSignals(False)
+            self.url_table.setUpdatesEnabled(True)
+        
+        for i, url in enumerate(new_urls, base):
+            self.fetch_video_title(i, url)
     
     def resizeEvent(self, event):
         """Handle window resize event."""
         super().resizeEvent(event)
         self.config["window_width"] = self.width()
         self.config["window_height"] = self.height()
-        save_config(self.config)
+        self._save_timer.start()
     
     def closeEvent(self, event):
         """Handle window close event."""
-        # Clean up resources
+        # Clean up resources; drop title lookups that haven't started yet
+        self.title_pool.clear()
+        self.title_pool.waitForDone(1000)
+        
         if self.download_worker and self.download_worker.isRunning():
             self.download_worker.cancel()
             self.download_worker.wait()
@@ -586,7 +751,7 @@ class YouTubeDownloaderGUI(QMainWindow):
             self.summary_worker.cancel()
             self.summary_worker.wait()
         
-        # Save configuration
-        save_config(self.config)
+        # Save configuration now rather than waiting for the timer
+        self.persist_config()
         
         event.accept() 
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Theme definitions for the GUI."""
-AVAILABLE_THEMES = ["matrix", "dark"]
+AVAILABLE_THEMES = ("matrix", "dark")
+# (theme name, menu label) pairs, built once at import
+THEME_MENU_ITEMS = tuple((theme, theme.capitalize()) for theme in AVAILABLE_THEMES)
 
 def get_matrix_stylesheet():
     """Get the Matrix-inspired theme stylesheet."""
@@ -229,4 +231,11 @@ def get_dark_stylesheet():
         QMenu::item:selected {
             background-color: #3D3D3D;
         }
-    """ 
\ No newline at end of file
+    """ 
+
+# Stylesheet function for each theme name, so apply_theme needs no
+# changes when a theme is added
+THEME_LOADERS = {
+    "matrix": get_matrix_stylesheet,
+    "dark": get_dark_stylesheet,
+}
@@ -1,14 +1,21 @@
 """Worker threads for background processing."""
 import os
+import io
 import json
+import math
 import time
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtCore import QThread, pyqtSignal
 import yt_dlp
-from ..core.summarizer import YouTubeSummarizer
+from ..core.summarizer import get_summarizer
 from ..models.summary_depth import SummaryDepth
 
+# Held while picking a versioned filename and creating the file, so
+# concurrent saves can't claim the same name
+_filename_lock = threading.Lock()
+
 class ProgressHandler(logging.Handler):
     """Custom logging handler that emits progress signals."""
     def __init__(self, signal):
@@ -16,21 +23,39 @@ class ProgressHandler(logging.Handler):
         self.signal = signal
     
     def emit(self, record):
-        self.signal.emit(self.format(record))
+        # Messages are emitted as-is, so skip the Formatter pipeline
+        self.signal.emit(record.getMessage())
 
 class DownloadWorker(QThread):
     """Worker thread for downloading videos."""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
     
-    def __init__(self, url, format_type, quality, output_folder, custom_title=None):
+    PROGRESS_INTERVAL = 0.2
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
+    def __init__(self, url, format_type, quality, output_folder, custom_title=None,
+                 concurrent_fragments=5):
         super().__init__()
         self.url = url
         self.format_type = format_type
         self.quality = quality
         self.output_folder = output_folder
         self.custom_title = custom_title
+        self.concurrent_fragments = concurrent_fragments
         self.is_cancelled = False
+        # yt-dlp calls the progress hook many times a second; report at most
+        # every PROGRESS_INTERVAL seconds
+        self._last_progress = 0.0
+        
+        # Resolve the format and output template once, before the thread starts
+        self._format_spec = self.get_format_spec()
+        if custom_title:
+            sanitized_title = custom_title.replace(' ', '_')
+            sanitized_title = ''.join(c for c in sanitized_title if c.isalnum() or c in '_-')
+            self._outtmpl = os.path.join(output_folder, f"{sanitized_title}.%(ext)s")
+        else:
+            self._outtmpl = os.path.join(output_folder, '%(title)s.%(ext)s')
     
     def run(self):
         """Main thread execution method."""
@@ -44,12 +69,12 @@ class DownloadWorker(QThread):
             
             # Add custom handler that emits progress signals
             handler = ProgressHandler(self.progress)
-            handler.setFormatter(logging.Formatter('%(message)s'))
             thread_logger.addHandler(handler)
             
             # Configure yt-dlp options
             ydl_opts = {
-                'format': self.get_format_spec(),
+                'format': self._format_spec,
+                'outtmpl': self._outtmpl,
                 'progress_hooks': [self.handle_progress],
                 'restrictfilenames': True,
                 'windowsfilenames': True,
@@ -59,19 +84,14 @@ class DownloadWorker(QThread):
                 'extract_flat': False,
                 'retries': 3,
                 'fragment_retries': 3,
+                # Fetch HLS/DASH fragments over several connections at once,
+                # since servers often throttle each connection
+                'concurrent_fragment_downloads': self.concurrent_fragments,
                 'file_access_retries': 3,
                 'extractor_retries': 3,
                 'ignoreerrors': False,
             }
             
-            # Set output template based on custom title or default
-            if self.custom_title:
-                sanitized_title = self.custom_title.replace(' ', '_')
-                sanitized_title = ''.join(c for c in sanitized_title if c.isalnum() or c in '_-')
-                ydl_opts['outtmpl'] = os.path.join(self.output_folder, f"{sanitized_title}.%(ext)s")
-            else:
-                ydl_opts['outtmpl'] = os.path.join(self.output_folder, '%(title)s.%(ext)s')
-            
             # Download the video
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([self.url])
@@ -96,6 +116,10 @@ class DownloadWorker(QThread):
     def handle_progress(self, d):
         """Handle download progress updates."""
         if d['status'] == 'downloading':
+            now = time.monotonic()
+            if now - self._last_progress < self.PROGRESS_INTERVAL:
+                return
+            self._last_progress = now
             try:
                 total = d.get('total_bytes', 0)
                 downloaded = d.get('downloaded_bytes', 0)
@@ -103,9 +127,10 @@ class DownloadWorker(QThread):
                 eta = d.get('eta', 0)
                 
                 if total:
+                    format_size = self.format_size
                     percent = (downloaded / total) * 100
-                    size_str = f"{self.format_size(downloaded)}/{self.format_size(total)}"
-                    speed_str = self.format_size(speed) + "/s"
+                    size_str = f"{format_size(downloaded)}/{format_size(total)}"
+                    speed_str = format_size(speed) + "/s"
                     eta_str = self.format_time(eta)
                     
                     self.progress.emit(
@@ -117,81 +142,174 @@ class DownloadWorker(QThread):
         elif d['status'] == 'finished':
             self.progress.emit("Download completed, processing...")
     
-    def format_size(self, size):
+    @staticmethod
+    def format_size(size):
         """Format size in bytes to human readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+        # Each unit is 2**10 of the previous one, so the unit index is
+        # log2(size) // 10
+        index = min(int(math.log2(max(size, 1))) // 10, 4)
+        return f"{size / (1 << (index * 10)):.1f}{DownloadWorker.SIZE_UNITS[index]}"
     
-    def format_time(self, seconds):
+    @staticmethod
+    def format_time(seconds):
         """Format time in seconds to human readable string."""
         if seconds < 60:
             return f"{seconds}s"
-        minutes = seconds / 60
-        if minutes < 60:
-            return f"{minutes:.1f}m"
-        hours = minutes / 60
-        return f"{hours:.1f}h"
+        if seconds < 3600:
+            return f"{seconds / 60:.1f}m"
+        return f"{seconds / 3600:.1f}h"
     
     def cancel(self):
         """Mark the thread as cancelled to prevent further processing."""
         self.is_cancelled = True
 
-class TranscriptWorker(QThread):
-    """Worker thread for generating transcripts."""
-    progress = pyqtSignal(str)
+class BatchedProgressWorker(QThread):
+    """Worker thread that coalesces progress messages into batched signals."""
+    progress = pyqtSignal(list)
     finished = pyqtSignal(bool, str)
     
+    # Flush once this many messages are pending or this much time has passed
+    FLUSH_COUNT = 8
+    FLUSH_INTERVAL = 0.05
+    
+    def __init__(self):
+        super().__init__()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        # URLs are processed on pool threads, which all report progress
+        self._progress_lock = threading.Lock()
+        # Names in the output folder, scanned once per run so picking a
+        # filename doesn't stat every candidate; guarded by _filename_lock
+        self._existing_names = None
+    
+    def _emit(self, message, flush=False):
+        """Queue a progress message, flushing when the batch is due."""
+        with self._progress_lock:
+            self._pending.append(message)
+            if (flush or len(self._pending) >= self.FLUSH_COUNT
+                    or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+                self._flush_pending()
+    
+    def _flush_progress(self):
+        """Emit all pending progress messages as a single signal."""
+        with self._progress_lock:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """Emit pending messages; the caller holds the progress lock."""
+        if self._pending:
+            self.progress.emit(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+    
+    def scan_output_folder(self):
+        """Snapshot the file names in the output folder."""
+        try:
+            with os.scandir(self.output_folder or ".") as entries:
+                self._existing_names = {entry.name for entry in entries}
+        except OSError:
+            self._existing_names = None
+    
+    def claim_filename(self, base_filename, extension):
+        """Pick the next unused versioned filename and record it as taken."""
+        if self._existing_names is None:
+            counter = 1
+            filename = f"{base_filename}{extension}"
+            while os.path.exists(filename):
+                filename = f"{base_filename}_{counter}{extension}"
+                counter += 1
+            return filename
+        
+        directory, base_name = os.path.split(base_filename)
+        counter = 1
+        name = f"{base_name}{extension}"
+        while name in self._existing_names:
+            name = f"{base_name}_{counter}{extension}"
+            counter += 1
+        self._existing_names.add(name)
+        return os.path.join(directory, name)
+    
+    def process_urls(self, process_url, max_workers):
+        """Run process_url for every URL concurrently.
+        
+        process_url returns the messages for its URL, which are reported
+        together once it finishes so one video's lines stay in one block.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(self.urls))))
+        try:
+            futures = [executor.submit(process_url, url) for url in self.urls]
+            for future in as_completed(futures):
+                for message in future.result():
+                    self._emit(message)
+                self._emit("---", flush=True)
+                if self.is_cancelled:
+                    break
+        finally:
+            # On cancel, drop the URLs that haven't started
+            executor.shutdown(wait=True, cancel_futures=self.is_cancelled)
+            # Record this batch's cache entries now; the window can stay open
+            # for a long time, and entries left for the exit hook are lost
+            # if the process dies first
+            self.summarizer.cache.flush()
+
+class TranscriptWorker(BatchedProgressWorker):
+    """Worker thread for generating transcripts."""
+    
     def __init__(self, urls, output_folder=None):
         super().__init__()
-        self.urls = urls
+        # Drop duplicate URLs, keeping the order they were entered in
+        self.urls = list(dict.fromkeys(urls))
         self.output_folder = output_folder
         self.is_cancelled = False
-        self.summarizer = YouTubeSummarizer()
+        self.summarizer = get_summarizer()
     
     def format_timestamp(self, seconds):
         """Convert seconds to HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        seconds = int(seconds % 60)
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         return f"{minutes:02d}:{seconds:02d}"
     
     def format_transcript_chunk(self, chunk):
         """Format a chunk of transcript entries with bullet points and fewer timestamps."""
-        formatted_lines = []
-        chunk_start = self.format_timestamp(chunk[0]['start'])
-        chunk_end = self.format_timestamp(chunk[-1]['start'] + chunk[-1]['duration'])
-        formatted_lines.append(f"\n[{chunk_start} - {chunk_end}]")
-        formatted_lines.append("-" * 40)  # Separator line
+        # Bullets are written straight into one buffer instead of being
+        # collected as lines and joined at the end
+        out = io.StringIO()
+        # Bound once, as the loop below runs for every transcript entry
+        write = out.write
+        format_timestamp = self.format_timestamp
+        
+        chunk_start = format_timestamp(chunk[0]['start'])
+        chunk_end = format_timestamp(chunk[-1]['start'] + chunk[-1]['duration'])
+        write(f"\n[{chunk_start} - {chunk_end}]\n")
+        write("-" * 40)  # Separator line
         
         last_timestamp = chunk[0]['start']
-        current_text = []
+        bullet_open = False
         
         for entry in chunk:
-            time_gap = entry['start'] - last_timestamp if current_text else 0
-            
-            if time_gap > 2.0 and current_text:
-                formatted_lines.append(f"• {' '.join(current_text)}")
-                current_text = []
-                timestamp = self.format_timestamp(entry['start'])
-                current_text.append(f"[{timestamp}] {entry['text']}")
+            start = entry['start']
+            if bullet_open and start - last_timestamp > 2.0:
+                write(f"\n• [{format_timestamp(start)}] {entry['text']}")
+            elif bullet_open:
+                write(" ")
+                write(entry['text'])
             else:
-                current_text.append(entry['text'])
+                write("\n• ")
+                write(entry['text'])
+                bullet_open = True
             
-            last_timestamp = entry['start']
-        
-        if current_text:
-            formatted_lines.append(f"• {' '.join(current_text)}")
+            last_timestamp = start
         
-        return "\n".join(formatted_lines)
+        return out.getvalue()
     
     def chunk_transcript(self, transcript, chunk_duration=300):
-        """Split transcript into chunks of specified duration (default 5 minutes)."""
-        chunks = []
+        """Yield transcript chunks of specified duration (default 5 minutes).
+        
+        transcript can be any iterable of entries, such as
+        Cache.iter_transcript, since it is only read once.
+        """
         current_chunk = []
         chunk_start = 0
         
@@ -199,29 +317,38 @@ class TranscriptWorker(QThread):
             time_since_chunk_start = entry['start'] - chunk_start
             if time_since_chunk_start >= chunk_duration or (current_chunk and entry['start'] - (current_chunk[-1]['start'] + current_chunk[-1]['duration']) > 5):
                 if current_chunk:
-                    chunks.append(current_chunk)
+                    yield current_chunk
                 current_chunk = []
                 chunk_start = entry['start']
             current_chunk.append(entry)
         
         if current_chunk:
-            chunks.append(current_chunk)
+            yield current_chunk
+    
+    def format_transcript_body(self, transcript):
+        """Format transcript entries as timestamped chunks.
         
-        return chunks
+        Returns the text and the end time of the last entry, tracked as
+        the entries stream past so transcript needn't be a list.
+        """
+        parts = []
+        duration = 0
+        for chunk in self.chunk_transcript(transcript):
+            parts.append(self.format_transcript_chunk(chunk))
+            duration = chunk[-1]['start'] + chunk[-1]['duration']
+        return "\n".join(parts), duration
     
-    def format_transcript(self, transcript, video_title, video_url, duration):
-        """Format the full transcript with metadata."""
+    def format_transcript(self, body, video_title, video_url, duration):
+        """Format the full transcript with metadata around a formatted body."""
         formatted_lines = [
             f"Title: {video_title}",
             f"URL: {video_url}",
             f"Duration: {self.format_timestamp(duration)}",
             "\nTranscript:",
-            "=" * 50  # Separator line
+            "=" * 50,  # Separator line
+            body
         ]
         
-        for chunk in self.chunk_transcript(transcript):
-            formatted_lines.append(self.format_transcript_chunk(chunk))
-        
         return "\n".join(formatted_lines)
     
     def run(self):
@@ -230,91 +357,106 @@ class TranscriptWorker(QThread):
             return
             
         try:
-            for url in self.urls:
-                if self.is_cancelled:
-                    break
-                    
-                try:
-                    self.progress.emit(f"Getting transcript for {url}")
-                    video_id = self.summarizer.get_video_id(url)
-                    if not video_id:
-                        self.progress.emit(f"❌ Error: Could not extract video ID from URL: {url}")
-                        self.progress.emit("---")
-                        continue
-                    
-                    # Get video title and transcript
-                    video_title = self.summarizer.get_video_title(video_id)
-                    self.progress.emit(f"Processing transcript for: {video_title}")
-                    
-                    transcript = self.summarizer.get_transcript(video_id)
-                    if not transcript:
-                        self.progress.emit(f"❌ Error: Could not get transcript for {url}")
-                        self.progress.emit("---")
-                        continue
-                    
-                    # Format the full transcript with metadata
-                    formatted_transcript = self.format_transcript(
-                        transcript,
-                        video_title,
-                        url,
-                        transcript[-1]['start'] + transcript[-1]['duration']
-                    )
-                    
-                    # Save transcript
-                    sanitized_title = video_title.replace(" ", "_")
-                    base_transcript_file = f"{sanitized_title}_transcript"
-                    
-                    if self.output_folder:
-                        base_transcript_file = os.path.join(self.output_folder, os.path.basename(base_transcript_file))
-                    
-                    transcript_file = self.get_next_available_filename(base_transcript_file, ".txt")
-                    
-                    with open(transcript_file, 'w', encoding='utf-8') as f:
-                        f.write(formatted_transcript)
-                    
-                    self.progress.emit(f"✓ Transcript saved to: {transcript_file}")
-                    self.progress.emit("---")
-                    
-                except Exception as e:
-                    self.progress.emit(f"❌ Error processing {url}: {str(e)}")
-                    self.progress.emit("---")
+            self.scan_output_folder()
+            
+            # Each URL is independent network work, so fetch several at once
+            self.process_urls(self.process_url, 8)
             
             if not self.is_cancelled:
-                self.progress.emit("✨ Transcript generation completed!")
+                self._emit("✨ Transcript generation completed!", flush=True)
                 self.finished.emit(True, "All transcripts processed successfully!")
                 
         except Exception as e:
+            self._flush_progress()
             if not self.is_cancelled:
                 self.finished.emit(False, f"Error: {str(e)}")
     
+    def process_url(self, url):
+        """Fetch, format and save the transcript for one URL, returning its messages."""
+        messages = []
+        if self.is_cancelled:
+            return messages
+        
+        try:
+            self._emit(f"Getting transcript for {url}", flush=True)
+            video_id = self.summarizer.get_video_id(url)
+            if not video_id:
+                messages.append(f"❌ Error: Could not extract video ID from URL: {url}")
+                return messages
+            
+            # Get video title and transcript
+            video_title = self.summarizer.get_video_title(video_id)
+            messages.append(f"Processing transcript for: {video_title}")
+            
+            # A transcript already in the cache is streamed from disk below
+            # rather than loaded whole; fetching one stores it in the cache
+            cache = self.summarizer.cache
+            transcript = None
+            source_size = cache.get_transcript_size(video_id)
+            if source_size is None:
+                transcript = self.summarizer.get_transcript(video_id)
+                if not transcript:
+                    messages.append(f"❌ Error: Could not get transcript for {url}")
+                    return messages
+                source_size = cache.get_transcript_size(video_id)
+            
+            # Formatting is deterministic, so reuse the body from an earlier
+            # run unless the cached transcript has changed since
+            cached = cache.get_formatted_transcript(video_id, source_size)
+            if cached is not None:
+                body, duration = cached
+            else:
+                entries = transcript if transcript is not None else cache.iter_transcript(video_id)
+                body, duration = self.format_transcript_body(entries)
+                if not body:
+                    messages.append(f"❌ Error: Could not get transcript for {url}")
+                    return messages
+                cache.cache_formatted_transcript(video_id, source_size, body, duration)
+            
+            # Format the full transcript with metadata
+            formatted_transcript = self.format_transcript(body, video_title, url, duration)
+            
+            # Save transcript
+            sanitized_title = video_title.replace(" ", "_")
+            base_transcript_file = f"{sanitized_title}_transcript"
+            
+            if self.output_folder:
+                base_transcript_file = os.path.join(self.output_folder, os.path.basename(base_transcript_file))
+            
+            with _filename_lock:
+                transcript_file = self.get_next_available_filename(base_transcript_file, ".txt")
+                with open(transcript_file, 'w', encoding='utf-8', buffering=65536) as f:
+                    f.write(formatted_transcript)
+            
+            messages.append(f"✓ Transcript saved to: {transcript_file}")
+            
+        except Exception as e:
+            messages.append(f"❌ Error processing {url}: {str(e)}")
+        return messages
+    
     def get_next_available_filename(self, base_filename, extension):
         """Get the next available filename by appending a number if needed."""
-        counter = 1
-        filename = f"{base_filename}{extension}"
-        
-        while os.path.exists(filename):
-            filename = f"{base_filename}_{counter}{extension}"
-            counter += 1
-        
-        return filename
+        return self.claim_filename(base_filename, extension)
     
     def cancel(self):
         """Mark the thread as cancelled to prevent further processing."""
         self.is_cancelled = True
 
-class SummaryWorker(QThread):
+class SummaryWorker(BatchedProgressWorker):
     """Worker thread for generating summaries."""
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)
     
     def __init__(self, urls, output_folder, depth, model):
         super().__init__()
-        self.urls = urls
+        # Drop duplicate URLs, keeping the order they were entered in
+        self.urls = list(dict.fromkeys(urls))
         self.output_folder = output_folder
         self.depth = depth
+        self._depth_label = depth.value.capitalize()
         self.model = model
         self.is_cancelled = False
-        self.summarizer = YouTubeSummarizer()
+        self.summarizer = get_summarizer()
+        # URL -> video title, looked up before the summaries start
+        self._titles = {}
     
     def run(self):
         """Main thread execution method."""
@@ -322,68 +464,74 @@ class SummaryWorker(QThread):
             return
         
         try:
-            for url in self.urls:
-                if self.is_cancelled:
-                    break
-                
-                try:
-                    self.progress.emit(f"Getting video information for {url}")
-                    video_id = self.summarizer.get_video_id(url)
-                    if not video_id:
-                        self.progress.emit(f"❌ Error: Could not extract video ID from URL: {url}")
-                        self.progress.emit("---")
-                        continue
-                    
-                    # Get video title
-                    video_title = self.summarizer.get_video_title(video_id)
-                    self.progress.emit(f"Processing video: {video_title}")
-                    
-                    # Generate summary
-                    self.progress.emit(f"🤖 Generating AI summary (Depth: {self.depth.value.capitalize()}, Model: {self.model})...")
-                    summary = self.summarizer.summarize_video(url, self.depth, self.model)
-                    
-                    if summary:
-                        # Add the title at the beginning of the summary
-                        summary_with_title = f"# {video_title}\n\n{summary}"
-                        
-                        # Save summary
-                        base_summary_file = f"{video_title} - summary"
-                        summary_file = self.get_next_available_filename(base_summary_file, ".md", self.output_folder)
-                        
-                        with open(summary_file, 'w', encoding='utf-8') as f:
-                            f.write(summary_with_title)
-                        
-                        self.progress.emit(f"✓ Summary saved to: {summary_file}")
-                    else:
-                        self.progress.emit(f"❌ Error: Could not generate summary for {url}")
-                    
-                    self.progress.emit("---")
-                    
-                except Exception as e:
-                    self.progress.emit(f"❌ Error processing {url}: {str(e)}")
-                    self.progress.emit("---")
+            self.scan_output_folder()
+            
+            # Look the titles up first, several at once, so saving a finished
+            # summary doesn't hold up the shared event loop on a network call
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(self.urls)))) as executor:
+                self._titles = dict(zip(self.urls, executor.map(self.lookup_title, self.urls)))
+            
+            # Summarize every video in one run, so they share one request
+            # session and the configured rate and concurrency limits hold
+            # across the whole batch rather than per video
+            self.summarizer.summarize_videos(
+                self.urls, self.depth, self.model,
+                on_complete=self.save_summary,
+                cancelled=lambda: self.is_cancelled
+            )
             
             if not self.is_cancelled:
-                self.progress.emit("✨ Summary generation completed!")
+                self._emit("✨ Summary generation completed!", flush=True)
                 self.finished.emit(True, "All summaries processed successfully!")
                 
         except Exception as e:
+            self._flush_progress()
             if not self.is_cancelled:
                 self.finished.emit(False, f"Error: {str(e)}")
     
+    def lookup_title(self, url):
+        """Get the title for one URL, reporting that its summary is queued."""
+        video_title = self.summarizer.get_video_title(self.summarizer.get_video_id(url))
+        self._emit(f"🤖 Generating AI summary for {video_title} (Depth: {self._depth_label}, Model: {self.model})...", flush=True)
+        return video_title
+    
+    def save_summary(self, url, summary, error):
+        """Save one finished summary and report it; called as each video completes."""
+        messages = []
+        video_title = self._titles[url]
+        messages.append(f"Processing video: {video_title}")
+        
+        try:
+            if error is not None:
+                messages.append(f"❌ Error processing {url}: {str(error)}")
+            elif summary:
+                # Add the title at the beginning of the summary
+                summary_with_title = f"# {video_title}\n\n{summary}"
+                
+                # Save summary
+                base_summary_file = f"{video_title} - summary"
+                with _filename_lock:
+                    summary_file = self.get_next_available_filename(base_summary_file, ".md", self.output_folder)
+                    with open(summary_file, 'w', encoding='utf-8', buffering=65536) as f:
+                        f.write(summary_with_title)
+                
+                messages.append(f"✓ Summary saved to: {summary_file}")
+            else:
+                messages.append(f"❌ Error: Could not generate summary for {url}")
+            
+        except Exception as e:
+            messages.append(f"❌ Error processing {url}: {str(e)}")
+        
+        for message in messages:
+            self._emit(message)
+        self._emit("---", flush=True)
+    
     def get_next_available_filename(self, base_filename, extension, output_dir=None):
         """Get the next available filename by appending a number if needed."""
         if output_dir:
             base_filename = os.path.join(output_dir, os.path.basename(base_filename))
         
-        counter = 1
-        filename = f"{base_filename}{extension}"
-        
-        while os.path.exists(filename):
-            filename = f"{base_filename}_{counter}{extension}"
-            counter += 1
-        
-        return filename
+        return self.claim_filename(base_filename, extension)
     
     def cancel(self):
         """Mark the thread as cancelled to prevent further processing."""
@@ -5,4 +5,15 @@ class SummaryDepth(Enum):
     """Available summary depth levels."""
     BASIC = "basic"
     DETAILED = "detailed"
-    TECHNICAL = "technical" 
\ No newline at end of file
+    TECHNICAL = "technical"
+    
+    @classmethod
+    def from_str(cls, value: str) -> "SummaryDepth":
+        """Get the depth for a value string with a dict lookup."""
+        try:
+            return _BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+# Built once so from_str doesn't scan the members on every call
+_BY_VALUE = {depth.value: depth for depth in SummaryDepth}
@@ -0,0 +1,62 @@
+"""OpenAI Batch API submission for non-interactive summary runs."""
+import json
+import time
+from typing import List, Dict
+import openai
+
+class BatchError(Exception):
+    """Exception raised when a batch does not complete."""
+    pass
+
+def submit_batch(client: openai.OpenAI, requests: List[Dict]) -> str:
+    """
+    Upload chat completion requests and start a batch for them.
+    
+    Args:
+        client: OpenAI client to submit with
+        requests: Batch request lines, each with custom_id, method, url and body
+    
+    Returns:
+        ID of the created batch
+    """
+    data = "".join(json.dumps(request) + "\n" for request in requests).encode("utf-8")
+    batch_file = client.files.create(file=("batch.jsonl", data), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    return batch.id
+
+def wait_for_batch(client: openai.OpenAI, batch_id: str, poll: float = 30) -> Dict[str, str]:
+    """
+    Poll a batch until it finishes and collect its replies.
+    
+    Args:
+        client: OpenAI client the batch was submitted with
+        batch_id: ID returned by submit_batch
+        poll: Seconds between status checks
+    
+    Returns:
+        Reply content keyed by each request's custom_id
+    
+    Raises:
+        BatchError: If the batch fails, expires or is cancelled
+    """
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise BatchError(f"Batch {batch_id} ended with status {batch.status}")
+        time.sleep(poll)
+    
+    results = {}
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            record = json.loads(line)
+            response = record.get("response")
+            if response and response["status_code"] == 200:
+                results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+    return results
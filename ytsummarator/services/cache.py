@@ -1,8 +1,36 @@
 """Cache management for transcripts and summaries."""
+import atexit
 import os
 import json
 import time
-from typing import List, Dict
+import threading
+import weakref
+from typing import List, Dict, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+# Caches with metadata still to write; held weakly so a dropped cache can be
+# collected, and flushed by the single exit hook below
+_open_caches = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_caches():
+    """Write the metadata of every cache still alive at exit."""
+    for cache in list(_open_caches):
+        cache.flush()
 
 class Cache:
     """Cache management for transcripts and summaries."""
@@ -10,25 +38,46 @@ class Cache:
         self.cache_dir = cache_dir
         self.transcript_dir = os.path.join(cache_dir, "transcripts")
         self.summary_dir = os.path.join(cache_dir, "summaries")
+        self.formatted_dir = os.path.join(cache_dir, "formatted")
         self.metadata_file = os.path.join(cache_dir, "cache_metadata.json")
         os.makedirs(self.transcript_dir, exist_ok=True)
         os.makedirs(self.summary_dir, exist_ok=True)
+        os.makedirs(self.formatted_dir, exist_ok=True)
+        # Videos can be cached from several worker threads at once
+        self._metadata_lock = threading.Lock()
         self.metadata = self.load_metadata()
+        # New entries are written by flush(), called after each batch of
+        # work and at exit, rather than rewriting the whole file for every
+        # cached item
+        self._dirty = False
+        _open_caches.add(self)
     
     def load_metadata(self) -> dict:
         """Load cache metadata."""
         if os.path.exists(self.metadata_file):
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            except:
+                with open(self.metadata_file, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson is not None else json.loads(data)
+            except (OSError, ValueError):
                 return {}
         return {}
     
     def save_metadata(self):
         """Save cache metadata."""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=4)
+        if orjson is not None:
+            data = orjson.dumps(self.metadata)
+        else:
+            data = json.dumps(self.metadata, separators=(',', ':')).encode('utf-8')
+        with open(self.metadata_file, 'wb') as f:
+            f.write(data)
+    
+    def flush(self):
+        """Save cache metadata if entries were added since the last save."""
+        with self._metadata_lock:
+            if self._dirty:
+                self._dirty = False
+                self.save_metadata()
     
     def get_transcript_path(self, video_id: str) -> str:
         """Get the path for a cached transcript."""
@@ -38,6 +87,17 @@ class Cache:
         """Get the path for a cached summary."""
         return os.path.join(self.summary_dir, f"{video_id}_{depth}_{model}.md")
     
+    def get_formatted_transcript_path(self, video_id: str) -> str:
+        """Get the path for a cached formatted transcript."""
+        return os.path.join(self.formatted_dir, f"{video_id}.txt")
+    
+    def get_transcript_size(self, video_id: str) -> Optional[int]:
+        """Get the size in bytes of a cached transcript, or None if it isn't cached."""
+        try:
+            return os.stat(self.get_transcript_path(video_id)).st_size
+        except FileNotFoundError:
+            return None
+    
     def has_transcript(self, video_id: str) -> bool:
         """Check if transcript is cached."""
         return os.path.exists(self.get_transcript_path(video_id))
@@ -48,51 +108,180 @@ class Cache:
     
     def get_transcript(self, video_id: str) -> List[Dict]:
         """Get cached transcript."""
-        if self.has_transcript(video_id):
-            with open(self.get_transcript_path(video_id), 'r') as f:
-                return json.load(f)
-        return None
+        # Opening the file is the existence check; a separate one would
+        # cost a second stat on every hit
+        try:
+            with open(self.get_transcript_path(video_id), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    def iter_transcript(self, video_id: str) -> Iterator[Dict]:
+        """Iterate over a cached transcript's entries.
+        
+        With ijson installed the file is parsed incrementally, so only one
+        entry is held at a time; otherwise it is loaded whole.
+        """
+        if ijson is None:
+            yield from self.get_transcript(video_id) or ()
+            return
+        try:
+            with open(self.get_transcript_path(video_id), 'rb') as f:
+                yield from ijson.items(f, 'item', use_float=True)
+        except FileNotFoundError:
+            return
     
     def get_summary(self, video_id: str, depth: str, model: str) -> str:
         """Get cached summary."""
-        if self.has_summary(video_id, depth, model):
-            with open(self.get_summary_path(video_id, depth, model), 'r') as f:
+        try:
+            with open(self.get_summary_path(video_id, depth, model), 'r', encoding='utf-8') as f:
                 return f.read()
-        return None
+        except FileNotFoundError:
+            return None
+    
+    def get_formatted_transcript(self, video_id: str, source_size: int) -> Optional[Tuple[str, float]]:
+        """Get a cached formatted transcript and its duration.
+        
+        Returns None if it is missing, or stale because it was formatted
+        from a cached transcript of a different size.
+        """
+        data = self.metadata.get(f"formatted_{video_id}")
+        if data is None or data.get("source_size") != source_size:
+            return None
+        try:
+            with open(self.get_formatted_transcript_path(video_id), 'r', encoding='utf-8') as f:
+                return f.read(), data["duration"]
+        except FileNotFoundError:
+            return None
     
     def cache_transcript(self, video_id: str, transcript: List[Dict]):
         """Cache transcript."""
-        with open(self.get_transcript_path(video_id), 'w') as f:
-            json.dump(transcript, f)
-        self.metadata[f"transcript_{video_id}"] = {
-            "timestamp": time.time(),
-            "size": len(str(transcript))
-        }
-        self.save_metadata()
+        path = self.get_transcript_path(video_id)
+        with open(path, 'w', encoding='utf-8', buffering=65536) as f:
+            json.dump(transcript, f, separators=(',', ':'), ensure_ascii=False)
+            size = f.tell()
+        with self._metadata_lock:
+            self.metadata[f"transcript_{video_id}"] = {
+                "timestamp": time.time(),
+                "size": size,
+                "path": path
+            }
+            self._dirty = True
     
     def cache_summary(self, video_id: str, depth: str, model: str, summary: str):
         """Cache summary."""
-        with open(self.get_summary_path(video_id, depth, model), 'w') as f:
+        path = self.get_summary_path(video_id, depth, model)
+        with open(path, 'w', encoding='utf-8') as f:
             f.write(summary)
-        self.metadata[f"summary_{video_id}_{depth}_{model}"] = {
-            "timestamp": time.time(),
-            "size": len(summary)
-        }
-        self.save_metadata()
+            size = f.tell()
+        with self._metadata_lock:
+            self.metadata[f"summary_{video_id}_{depth}_{model}"] = {
+                "timestamp": time.time(),
+                "size": size,
+                "path": path
+            }
+            self._dirty = True
+    
+    def cache_formatted_transcript(self, video_id: str, source_size: int, text: str, duration: float):
+        """Cache a formatted transcript, keyed by the cached transcript's size."""
+        path = self.get_formatted_transcript_path(video_id)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            size = f.tell()
+        with self._metadata_lock:
+            self.metadata[f"formatted_{video_id}"] = {
+                "timestamp": time.time(),
+                "size": size,
+                "path": path,
+                "source_size": source_size,
+                "duration": duration
+            }
+            self._dirty = True
+    
+    def get_entry_path(self, key: str, data: dict) -> Optional[str]:
+        """Get the file behind a metadata entry.
+        
+        Entries record their path; older ones are resolved from the key.
+        Video IDs can contain underscores, so summary keys are split from
+        the right, where depth and model never do.
+        """
+        if "path" in data:
+            return data["path"]
+        if key.startswith("transcript_"):
+            return self.get_transcript_path(key[len("transcript_"):])
+        if key.startswith("summary_"):
+            video_id, depth, model = key[len("summary_"):].rsplit("_", 2)
+            return self.get_summary_path(video_id, depth, model)
+        if key.startswith("formatted_"):
+            return self.get_formatted_transcript_path(key[len("formatted_"):])
+        return None
     
     def cleanup(self, max_age_days: int = 30):
         """Clean up old cache entries."""
         current_time = time.time()
         max_age = max_age_days * 24 * 60 * 60  # Convert days to seconds
         
-        for key, data in list(self.metadata.items()):
-            if current_time - data["timestamp"] > max_age:
-                if key.startswith("transcript_"):
-                    video_id = key.split("_")[1]
-                    os.remove(self.get_transcript_path(video_id))
-                elif key.startswith("summary_"):
-                    _, video_id, depth, model = key.split("_")
-                    os.remove(self.get_summary_path(video_id, depth, model))
-                del self.metadata[key]
-        
-        self.save_metadata() 
\ No newline at end of file
+        with self._metadata_lock:
+            for key, data in list(self.metadata.items()):
+                if current_time - data["timestamp"] > max_age:
+                    path = self.get_entry_path(key, data)
+                    if path:
+                        try:
+                            os.remove(path)
+                        except FileNotFoundError:
+                            pass
+                    del self.metadata[key]
+            
+            # Save once, after all deletions
+            self._dirty = False
+            self.save_metadata()
+
+class RedisCache:
+    """Per-chunk summary cache kept in Redis when configured, else in memory."""
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 30 * 24 * 60 * 60):
+        if redis_url and redis is None:
+            print("Warning: redis_url is set but the redis package is not installed; "
+                  "caching chunk summaries in memory")
+        self.redis_url = redis_url if redis is not None else None
+        self.ttl = ttl
+        self.memory = {}
+        # Each thread runs its own event loop, so each gets its own client
+        self._local = threading.local()
+    
+    @property
+    def client(self):
+        """The Redis client opened for this thread's current run, if any."""
+        return getattr(self._local, "client", None)
+    
+    async def __aenter__(self):
+        # The Redis client belongs to the running event loop, so it is
+        # opened per run rather than once for the cache's lifetime
+        if self.redis_url:
+            self._local.client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        if self.client is not None:
+            await self.client.aclose()
+            self._local.client = None
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached chunk summary."""
+        if self.client is None:
+            return self.memory.get(key)
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            print(f"Error reading from Redis: {str(e)}")
+            return None
+    
+    async def setex(self, key: str, value: str):
+        """Cache a chunk summary for the configured TTL."""
+        if self.client is None:
+            self.memory[key] = value
+            return
+        try:
+            await self.client.setex(key, self.ttl, value)
+        except Exception as e:
+            print(f"Error writing to Redis: {str(e)}")
@@ -0,0 +1,53 @@
+"""Rate limiting for OpenAI requests."""
+import asyncio
+import time
+
+class AsyncRateLimiter:
+    """Pace requests so a run stays inside the account's RPM and TPM limits.
+    
+    Both budgets refill continuously at their per-minute rate, up to one
+    minute's worth, and every request draws one request and its token cost.
+    """
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """Credit both budgets for the time elapsed since the last call."""
+        now = time.monotonic()
+        minutes = (now - self.last_update) / 60
+        self.last_update = now
+        self.available_requests = min(self.requests_per_minute,
+                                      self.available_requests + minutes * self.requests_per_minute)
+        self.available_tokens = min(self.tokens_per_minute,
+                                    self.available_tokens + minutes * self.tokens_per_minute)
+    
+    async def acquire(self, tokens: int) -> float:
+        """Reserve one request costing tokens, sleeping until both budgets allow it.
+        
+        Returns the number of seconds spent waiting, so callers can report
+        throttling.
+        """
+        # Cap the cost at the TPM limit: an oversized chunk is sent as soon as
+        # the token budget is full rather than blocking the run
+        tokens = min(tokens, self.tokens_per_minute)
+        waited = 0.0
+        # Holding the lock while sleeping keeps waiters in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                request_deficit = 1 - self.available_requests
+                token_deficit = tokens - self.available_tokens
+                if request_deficit <= 0 and token_deficit <= 0:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return waited
+                wait = max(request_deficit * 60 / self.requests_per_minute,
+                           token_deficit * 60 / self.tokens_per_minute,
+                           0.001)
+                await asyncio.sleep(wait)
+                waited += wait
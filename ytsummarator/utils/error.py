@@ -1,6 +1,8 @@
 """Error handling and retry logic."""
+import asyncio
+import random
 import time
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Awaitable, Optional, Tuple, Type
 
 class RetryError(Exception):
     """Exception raised when all retries are exhausted."""
@@ -12,7 +14,8 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2.0,
-    jitter: bool = True
+    jitter: bool = True,
+    retry_on: Tuple[Type[Exception], ...] = (Exception,)
 ) -> Any:
     """
     Retry a function with exponential backoff.
@@ -24,6 +27,7 @@ def retry_with_backoff(
         max_delay: Maximum delay between retries
         exponential_base: Base for exponential backoff
         jitter: Whether to add random jitter to delays
+        retry_on: Exception types worth retrying; others are raised at once
     
     Returns:
         Result of the function call
@@ -34,7 +38,7 @@ def retry_with_backoff(
     for attempt in range(max_retries):
         try:
             return func()
-        except Exception as e:
+        except retry_on as e:
             if attempt == max_retries - 1:
                 raise RetryError(f"Failed after {max_retries} attempts: {str(e)}")
             
@@ -46,8 +50,46 @@ def retry_with_backoff(
             
             # Add jitter if enabled
             if jitter:
-                delay *= (1 + (time.time() % 1) * 0.1)
+                delay *= random.uniform(1.0, 1.1)
             
             time.sleep(delay)
     
-    raise RetryError(f"Failed after {max_retries} attempts") 
\ No newline at end of file
+    raise RetryError(f"Failed after {max_retries} attempts") 
+
+async def async_retry_with_backoff(
+    func: Callable[[], Awaitable],
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 10.0,
+    exponential_base: float = 2.0,
+    jitter: bool = True,
+    retry_on: Tuple[Type[Exception], ...] = (Exception,)
+) -> Any:
+    """
+    Retry a coroutine function with exponential backoff.
+    
+    Same policy and arguments as retry_with_backoff, but awaits func()
+    and sleeps with asyncio.sleep so other tasks keep running between
+    attempts.
+    
+    Raises:
+        RetryError: If all retries are exhausted
+    """
+    for attempt in range(max_retries):
+        try:
+            return await func()
+        except retry_on as e:
+            if attempt == max_retries - 1:
+                raise RetryError(f"Failed after {max_retries} attempts: {str(e)}")
+            
+            delay = min(
+                base_delay * (exponential_base ** attempt),
+                max_delay
+            )
+            
+            if jitter:
+                delay *= random.uniform(1.0, 1.1)
+            
+            await asyncio.sleep(delay)
+    
+    raise RetryError(f"Failed after {max_retries} attempts")
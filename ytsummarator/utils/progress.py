@@ -7,17 +7,21 @@ class ProgressTracker:
         self.total_chunks = total_chunks
         self.current_chunk = 0
         self.start_time = time.time()
-        self.chunk_times = []
+        # Running total of the time between completions, so the mean costs
+        # O(1) per update
+        self.total_chunk_time = 0.0
+        self.last_chunk_end = self.start_time
     
     def update(self, chunk_index: int, chunk_size: int):
         """Update progress and display status."""
         self.current_chunk = chunk_index + 1
-        chunk_time = time.time() - self.start_time
-        self.chunk_times.append(chunk_time)
+        now = time.time()
+        self.total_chunk_time += now - self.last_chunk_end
+        self.last_chunk_end = now
         
         # Calculate progress
         progress = (self.current_chunk / self.total_chunks) * 100
-        avg_time = sum(self.chunk_times) / len(self.chunk_times)
+        avg_time = self.total_chunk_time / self.current_chunk
         remaining_chunks = self.total_chunks - self.current_chunk
         estimated_time = remaining_chunks * avg_time
         
@@ -29,7 +33,7 @@ class ProgressTracker:
     def complete(self):
         """Display completion message with statistics."""
         total_time = time.time() - self.start_time
-        avg_chunk_time = sum(self.chunk_times) / len(self.chunk_times)
+        avg_chunk_time = self.total_chunk_time / max(self.current_chunk, 1)
         print(f"\n\nSummary generation completed in {total_time:.1f}s")
         print(f"Average time per chunk: {avg_chunk_time:.1f}s")
         print(f"Total chunks processed: {self.total_chunks}") 
\ No newline at end of file